@@ -0,0 +1,101 @@
+from collections import OrderedDict
+import os
+from pathlib import Path
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+
+V = TypeVar('V')
+
+
+# least recently used entries are evicted once the summed size exceeds max_bytes
+class LruCache(Generic[V]):
+    def __init__(self, *, max_bytes: int, measure: Callable[[V], int]) -> None:
+        self.max_bytes = max_bytes
+        self.measure = measure
+        self.total_bytes = 0
+        self.values: OrderedDict[Hashable, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, key: Hashable, /) -> Optional[V]:
+        value = self.values.get(key)
+        if value is not None:
+            self.values.move_to_end(key)
+
+        return value
+
+    def put(self, key: Hashable, value: V, /) -> None:
+        self.remove(key)
+
+        size = self.measure(value)
+        if size > self.max_bytes:
+            return
+
+        self.values[key] = value
+        self.total_bytes += size
+
+        while self.total_bytes > self.max_bytes:
+            _, evicted_value = self.values.popitem(last=False)
+            self.total_bytes -= self.measure(evicted_value)
+
+    def remove(self, key: Hashable, /) -> None:
+        value = self.values.pop(key, None)
+        if value is not None:
+            self.total_bytes -= self.measure(value)
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.total_bytes = 0
+
+
+# stores one file per key, written atomically so concurrent workers never read partial values;
+# reads refresh a file's mtime so that the least recently used files are evicted first
+class DiskCache:
+    def __init__(self, *, directory_path: Path, max_bytes: int, suffix: str) -> None:
+        self.directory_path = directory_path
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+    def find_path(self, key: str, /) -> Path:
+        return self.directory_path / f'{key}{self.suffix}'
+
+    def get(self, key: str, /) -> Optional[bytes]:
+        path = self.find_path(key)
+        try:
+            value = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return value
+
+    def put(self, key: str, value: bytes, /) -> None:
+        path = self.find_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        temporary_path.write_bytes(value)
+        temporary_path.replace(path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory_path.glob(f'*{self.suffix}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process
+
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        entries.sort()
+
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total_bytes -= size
@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+import hashlib
+import pickle
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+
+S = TypeVar('S')
+
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+@dataclass(frozen=True, kw_only=True)
+class Cycle(Generic[S]):
+    initial_state: S
+    length: int  # lambda, the number of steps before a state repeats
+    start: int  # mu, the first step whose state is part of the loop
+    start_state: S
+    transition: Callable[[S], S]
+
+    def find_state(self, step_count: int, /) -> S:
+        if step_count < self.start:
+            state = self.initial_state
+            for _ in range(step_count):
+                state = self.transition(state)
+
+            return state
+
+        state = self.start_state
+        for _ in range((step_count - self.start) % self.length):
+            state = self.transition(state)
+
+        return state
+
+
+# a short digest that stands in for a state, so that only the digests of past states are
+# kept; pass a custom one for states whose pickled form is not canonical (e.g. sets)
+def fingerprint(state: Any, /) -> bytes:
+    data: Any
+    if isinstance(state, (bytes, bytearray, memoryview)):
+        data = state
+    elif isinstance(state, int):
+        data = state.to_bytes((state.bit_length() + 8) // 8, 'little', signed=True)
+    elif isinstance(state, str):
+        data = state.encode()
+    else:
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return hashlib.blake2b(data, digest_size=FINGERPRINT_DIGEST_SIZE).digest()
+
+
+# remembers a fingerprint of every state, so it takes exactly start + length steps;
+# returns None when no state repeats within max_steps
+def find_cycle(
+    initial_state: S,
+    /,
+    *,
+    fingerprint: Callable[[S], Any] = fingerprint,
+    max_steps: Optional[int] = None,
+    transition: Callable[[S], S],
+) -> Optional[Cycle[S]]:
+    steps_by_fingerprint: Dict[Any, int] = {fingerprint(initial_state): 0}
+
+    state = initial_state
+    step = 0
+    while max_steps is None or step < max_steps:
+        state = transition(state)
+        step += 1
+
+        key = fingerprint(state)
+        start = steps_by_fingerprint.get(key)
+        if start is not None:
+            return Cycle(
+                initial_state=initial_state,
+                length=step - start,
+                start=start,
+                start_state=state,
+                transition=transition,
+            )
+
+        steps_by_fingerprint[key] = step
+
+    return None
+
+
+# Brent's algorithm: keeps only two states and compares them exactly, at the cost of
+# running up to about three times as many transitions as find_cycle
+def find_cycle_brent(
+    initial_state: S,
+    /,
+    *,
+    max_steps: Optional[int] = None,
+    transition: Callable[[S], S],
+) -> Optional[Cycle[S]]:
+    power = 1
+    length = 1
+    step = 1
+    tortoise = initial_state
+    hare = transition(initial_state)
+    while tortoise != hare:
+        if max_steps is not None and step >= max_steps:
+            return None
+
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+
+        hare = transition(hare)
+        length += 1
+        step += 1
+
+    tortoise = initial_state
+    hare = initial_state
+    for _ in range(length):
+        hare = transition(hare)
+
+    start = 0
+    while tortoise != hare:
+        tortoise = transition(tortoise)
+        hare = transition(hare)
+        start += 1
+
+    return Cycle(
+        initial_state=initial_state,
+        length=length,
+        start=start,
+        start_state=tortoise,
+        transition=transition,
+    )
+
+
+# runs the detection loop of find_cycle itself, so that when no state repeats within
+# step_count steps the state it stopped on is the answer rather than a reason to start over
+def find_state(
+    initial_state: S,
+    step_count: int,
+    /,
+    *,
+    fingerprint: Callable[[S], Any] = fingerprint,
+    transition: Callable[[S], S],
+) -> S:
+    steps_by_fingerprint: Dict[Any, int] = {fingerprint(initial_state): 0}
+
+    state = initial_state
+    for step in range(1, step_count + 1):
+        state = transition(state)
+
+        key = fingerprint(state)
+        start = steps_by_fingerprint.get(key)
+        if start is not None:
+            for _ in range((step_count - step) % (step - start)):
+                state = transition(state)
+
+            return state
+
+        steps_by_fingerprint[key] = step
+
+    return state
@@ -1,37 +1,216 @@
-import inspect
+from dataclasses import dataclass
+import dataclasses
+import functools
+import hashlib
+import os
 from pathlib import Path
-from typing import Any, Callable
+import sys
+import types
+from typing import Dict, Optional
 
-from adventofcode.helpers import resources
+import parsy
 
+from adventofcode.helpers import cache, memo, paths, profiling, registry, resources
 
-def _print_result(*, is_example: bool, path: Path, result: str) -> None:
+
+FORCE_ENVIRONMENT_VARIABLE = 'AOC_FORCE'
+RESULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_result_cache = cache.DiskCache(
+    directory_path=paths.CACHE_DIRECTORY_PATH / 'results',
+    max_bytes=RESULT_CACHE_MAX_BYTES,
+    suffix='.txt',
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Answer:
+    is_cached: bool
+    peak_memory_bytes: Optional[int]
+    profile_trace: Optional[profiling.ProfileTrace]
+    result: str
+    timings: Optional[profiling.Timings]
+
+
+def is_forced() -> bool:
+    return os.environ.get(FORCE_ENVIRONMENT_VARIABLE, '') not in ('', '0')
+
+
+def _collect_source_modules(module: types.ModuleType, /, *, modules_by_name: Dict[str, types.ModuleType]) -> None:
+    if module.__name__ in modules_by_name:
+        return
+
+    modules_by_name[module.__name__] = module
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            dependency_name = value.__name__
+        else:
+            dependency_name = getattr(value, '__module__', None) or ''
+
+        if dependency_name.partition('.')[0] == paths.SOURCE_DIRECTORY_PATH.name and dependency_name in sys.modules:
+            _collect_source_modules(sys.modules[dependency_name], modules_by_name=modules_by_name)
+
+
+# covers the solution's own module plus every project module it pulls in, so editing
+# a helper invalidates the results of every solution that uses it; the python and parsy
+# versions are mixed in too, since upgrading either can change what the same source does
+@functools.lru_cache(maxsize=None)
+def _find_source_fingerprint(*, module_name: str) -> bytes:
+    modules_by_name: Dict[str, types.ModuleType] = {}
+    _collect_source_modules(sys.modules[module_name], modules_by_name=modules_by_name)
+
+    hasher = hashlib.sha256(f'{sys.version} parsy {parsy.__version__}'.encode())
+    for name, module in sorted(modules_by_name.items()):
+        module_path = getattr(module, '__file__', None)
+        if module_path is None:
+            continue
+
+        hasher.update(name.encode())
+        hasher.update(Path(module_path).read_bytes())
+
+    return hasher.digest()
+
+
+def _find_result_key(*, content: str, solution: registry.Solution) -> str:
+    source_fingerprint = _find_source_fingerprint(module_name=solution.module_name)
+    return hashlib.sha256(source_fingerprint + content.encode()).hexdigest()
+
+
+def _print_result(*, answer: Answer, is_example: bool, path: Path) -> None:
     descriptor = 'example' if is_example else 'actual'
+    cached_descriptor = ' (cached)' if answer.is_cached else ''
 
-    print(f'Wrote {descriptor} result to {path}')
+    print(f'Wrote {descriptor} result{cached_descriptor} to {path}')
     print('----')
-    print(result)
+    print(answer.result)
     print()
 
 
-def _execute(*, is_example: bool, consumer: Callable[[str], Any]) -> None:
-    # Copied from https://stackoverflow.com/a/60297932
-    # Changed to [2] because it's in a helper function
-    code_path = inspect.stack()[2].filename
+# memoized values are only valid for the input they were computed from, so they are
+# dropped as soon as the solution returns rather than kept alive for the next input
+def _consume(solution: registry.Solution, content: str, /) -> str:
+    try:
+        return str(solution.consumer(content))
+    finally:
+        memo.clear_all()
+
+
+# tracemalloc and cProfile each slow the solution down several times over, and not
+# evenly across parsing and solving, so every measurement gets a run of its own
+def _solve_with_measurements(solution: registry.Solution, /, *, is_example: bool) -> Answer:
+    file_reader = resources.read_example if is_example else resources.read_actual
+
+    read_stopwatch = profiling.Stopwatch()
+    with read_stopwatch.measure():
+        content = file_reader(directory_path=solution.resources_directory_path)
+
+    result: Optional[str] = None
+
+    timings = None
+    if profiling.is_timing_enabled():
+        parse_stopwatch = profiling.Stopwatch()
+        consume_stopwatch = profiling.Stopwatch()
+        memo.reset_all()
+
+        with profiling.measure_parsing(parse_stopwatch), consume_stopwatch.measure():
+            result = _consume(solution, content)
+
+        timings = profiling.Timings(
+            memo_statistics=memo.collect_statistics(),
+            parse_ns=parse_stopwatch.elapsed_ns,
+            read_ns=read_stopwatch.elapsed_ns,
+            solve_ns=consume_stopwatch.elapsed_ns - parse_stopwatch.elapsed_ns,
+            write_ns=0,  # filled in by record
+        )
+
+    peak_memory_bytes = None
+    if profiling.is_memory_tracing_enabled():
+        with profiling.trace_memory() as memory_trace:
+            result = _consume(solution, content)
+
+        peak_memory_bytes = memory_trace.peak_bytes
+
+    profile_trace = None
+    if profiling.is_profiling_enabled():
+        with profiling.profile(is_example=is_example, solution=solution) as profile_trace:
+            result = _consume(solution, content)
+
+    if result is None:
+        raise Exception('expected timing, memory tracing or profiling to be enabled')
+
+    _result_cache.put(_find_result_key(content=content, solution=solution), result.encode())
+
+    return Answer(
+        is_cached=False,
+        peak_memory_bytes=peak_memory_bytes,
+        profile_trace=profile_trace,
+        result=result,
+        timings=timings,
+    )
+
+
+# reads the input and returns the stringified result without writing anything;
+# results are reused until the input or the source of the solution changes
+def solve(solution: registry.Solution, /, *, is_example: bool) -> Answer:
+    # measuring is about a real run, so measured runs never read the cache
+    if profiling.is_timing_enabled() or profiling.is_memory_tracing_enabled() or profiling.is_profiling_enabled():
+        return _solve_with_measurements(solution, is_example=is_example)
 
     file_reader = resources.read_example if is_example else resources.read_actual
+
+    content = file_reader(directory_path=solution.resources_directory_path)
+    key = _find_result_key(content=content, solution=solution)
+
+    if not is_forced():
+        cached_result = _result_cache.get(key)
+        if cached_result is not None:
+            return Answer(
+                is_cached=True,
+                peak_memory_bytes=None,
+                profile_trace=None,
+                result=cached_result.decode(),
+                timings=None,
+            )
+
+    result = _consume(solution, content)
+    _result_cache.put(key, result.encode())
+
+    return Answer(
+        is_cached=False,
+        peak_memory_bytes=None,
+        profile_trace=None,
+        result=result,
+        timings=None,
+    )
+
+
+def record(*, answer: Answer, is_example: bool, solution: registry.Solution) -> None:
     file_writer = resources.write_example if is_example else resources.write_actual
 
-    content = file_reader(code_path=code_path)
-    result = str(consumer(content))
+    write_stopwatch = profiling.Stopwatch()
+    with write_stopwatch.measure():
+        output_path = file_writer(content=answer.result, directory_path=solution.resources_directory_path)
+
+    _print_result(answer=answer, is_example=is_example, path=output_path)
+
+    if answer.timings is not None:
+        profiling.print_timings(dataclasses.replace(answer.timings, write_ns=write_stopwatch.elapsed_ns))
+
+    if answer.peak_memory_bytes is not None:
+        profiling.print_peak_memory(answer.peak_memory_bytes)
+
+    if answer.profile_trace is not None:
+        profiling.print_profile(answer.profile_trace)
+
 
-    output_path = file_writer(code_path=code_path, content=result)
-    _print_result(is_example=is_example, path=output_path, result=result)
+def execute(solution: registry.Solution, /, *, is_example: bool) -> None:
+    answer = solve(solution, is_example=is_example)
+    record(answer=answer, is_example=is_example, solution=solution)
 
 
-def execute_example(consumer: Callable[[str], Any], /) -> None:
-    _execute(is_example=True, consumer=consumer)
+def execute_example(consumer: registry.Consumer, /) -> None:
+    execute(registry.find(consumer), is_example=True)
 
 
-def execute_actual(consumer: Callable[[str], Any], /) -> None:
-    _execute(is_example=False, consumer=consumer)
+def execute_actual(consumer: registry.Consumer, /) -> None:
+    execute(registry.find(consumer), is_example=False)
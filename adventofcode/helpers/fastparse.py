@@ -0,0 +1,76 @@
+import re
+from typing import List
+
+
+# Whole-buffer readers for the most common input shapes. Each one returns exactly what
+# the parsy grammar in the comment above it returns, without a Python call per character.
+
+INTEGER_PATTERN = re.compile(r'-?\d+')
+RECORD_PATTERN = re.compile(r'^(\w+) += +\((\w+), +(\w+)\)$', re.MULTILINE)
+
+
+def _split_lines(content: str, /) -> List[str]:
+    lines = content.rstrip('\n').split('\n')
+    if '' in lines:
+        raise Exception('expected every line to be non-empty')
+
+    return lines
+
+
+def _check_characters(content: str, /, *, characters: str) -> None:
+    unexpected = content.encode().translate(None, f'{characters}\n'.encode())
+    if len(unexpected) > 0:
+        raise Exception(f'unexpected characters: {sorted(set(unexpected.decode()))}')
+
+
+# parsers.NUMBER_LIST.sep_by(parsers.NEWLINE).skip(parsers.NEWLINE.many())
+# (NUMBER_LIST matches nothing too, so every newline, including the last, starts a new list)
+def integer_lists(content: str, /) -> List[List[int]]:
+    return [
+        [int(value) for value in line.split()]
+        for line in content.split('\n')
+    ]
+
+
+# parsers.NUMBER_LIST
+def integers(content: str, /) -> List[int]:
+    return [int(value) for value in INTEGER_PATTERN.findall(content)]
+
+
+# parsy.regex(f'[{characters}]').at_least(1).concat().sep_by(parsers.NEWLINE).skip(parsers.NEWLINE.many())
+def lines(content: str, /, *, characters: str) -> List[str]:
+    _check_characters(content, characters=characters)
+    return _split_lines(content)
+
+
+# parsy.regex(f'[{characters}]').at_least(1).sep_by(parsers.NEWLINE).skip(parsers.NEWLINE.many())
+def grid(content: str, /, *, characters: str) -> List[List[str]]:
+    return [
+        list(line)
+        for line in lines(content, characters=characters)
+    ]
+
+
+# ROW.sep_by(parsers.NEWLINE).sep_by(parsers.NEWLINE.times(2)).skip(parsers.NEWLINE.many())
+# where ROW = parsy.regex(f'[{characters}]').at_least(1).concat()
+def blocks(content: str, /, *, characters: str) -> List[List[str]]:
+    _check_characters(content, characters=characters)
+
+    return [
+        _split_lines(block)
+        for block in content.rstrip('\n').split('\n\n')
+    ]
+
+
+# NAME = (LEFT, RIGHT) lines, as in parsy.seq(NAME.skip(' = ('), NAME.skip(', '), NAME.skip(')'))
+def records(content: str, /) -> List[List[str]]:
+    matched = [
+        list(match.groups())
+        for match in RECORD_PATTERN.finditer(content)
+    ]
+
+    expected_count = sum(1 for line in content.split('\n') if len(line) > 0)
+    if len(matched) != expected_count:
+        raise Exception(f'expected {expected_count} records, found {len(matched)}')
+
+    return matched
@@ -1,3 +1,4 @@
+import mmap
 from pathlib import Path
 
 
@@ -6,6 +7,12 @@ def read_content(*, path: Path) -> str:
         return f.read()
 
 
+# the mapping stays valid after the file is closed, and pages are only read on access
+def map_content(*, path: Path) -> mmap.mmap:
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def write(*, content: str, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
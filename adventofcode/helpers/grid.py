@@ -0,0 +1,173 @@
+from typing import Iterator, Optional, Sequence, Tuple
+
+
+Location = Tuple[int, int]  # (row_index, column_index)
+
+ORTHOGONAL_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAGONAL_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+# A rectangle of single byte cells stored row after row in one bytearray. Rows start
+# `stride` bytes apart; when a grid is built straight from the input the stride is one
+# more than the width so the newlines stay in place as padding and nothing is copied
+# per row.
+class Grid:
+    __slots__ = ('cells', 'height', 'stride', 'width')
+
+    def __init__(self, *, cells: bytearray, height: int, width: int, stride: Optional[int] = None) -> None:
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.stride = width if stride is None else stride
+
+        if height > 0 and len(cells) < (height - 1) * self.stride + width:
+            raise Exception(f'expected at least {(height - 1) * self.stride + width} cells, got {len(cells)}')
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[str]], /) -> 'Grid':
+        if len(rows) == 0:
+            raise Exception('expected at least one row')
+
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise Exception('expected every row to have the same width')
+
+        return cls(
+            cells=bytearray(''.join(''.join(row) for row in rows).encode()),
+            height=len(rows),
+            width=width,
+        )
+
+    # pass the characters a cell may hold as alphabet to reject anything else
+    @classmethod
+    def from_content(cls, content: str, /, *, alphabet: Optional[bytes] = None) -> 'Grid':
+        cells = bytearray(content.rstrip('\n').encode())
+        if alphabet is not None:
+            unexpected = cells.translate(None, alphabet + b'\n')
+            if len(unexpected) > 0:
+                raise Exception(f'unexpected character: {chr(unexpected[0])}')
+
+        width = cells.find(b'\n')
+        if width == -1:
+            width = len(cells)
+
+        height = (len(cells) + 1) // (width + 1)
+        if len(cells) != height * (width + 1) - 1:
+            raise Exception('expected every row to have the same width')
+
+        cells.append(ord('\n'))
+        return cls(cells=cells, height=height, width=width, stride=width + 1)
+
+    def index(self, location: Location, /) -> int:
+        return location[0] * self.stride + location[1]
+
+    def location(self, index: int, /) -> Location:
+        return divmod(index, self.stride)
+
+    def contains(self, location: Location, /) -> bool:
+        return 0 <= location[0] < self.height and 0 <= location[1] < self.width
+
+    def __getitem__(self, location: Location, /) -> int:
+        return self.cells[location[0] * self.stride + location[1]]
+
+    def __setitem__(self, location: Location, value: int, /) -> None:
+        self.cells[location[0] * self.stride + location[1]] = value
+
+    def char(self, location: Location, /) -> str:
+        return chr(self[location])
+
+    def get(self, location: Location, /, *, default: int = -1) -> int:
+        if not self.contains(location):
+            return default
+
+        return self[location]
+
+    # views share memory with the grid, so they reflect later changes and can be written through
+    def row(self, row_index: int, /) -> memoryview:
+        start = row_index * self.stride
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, column_index: int, /) -> memoryview:
+        stop = (self.height - 1) * self.stride + column_index + 1
+        return memoryview(self.cells)[column_index:stop:self.stride]
+
+    def rows(self) -> Iterator[memoryview]:
+        for row_index in range(self.height):
+            yield self.row(row_index)
+
+    def columns(self) -> Iterator[memoryview]:
+        for column_index in range(self.width):
+            yield self.column(column_index)
+
+    def neighbors(self, location: Location, /, *, diagonal: bool = False) -> Iterator[Location]:
+        row_index, column_index = location
+        offsets = ORTHOGONAL_OFFSETS + DIAGONAL_OFFSETS if diagonal else ORTHOGONAL_OFFSETS
+
+        for row_offset, column_offset in offsets:
+            neighbor = (row_index + row_offset, column_index + column_offset)
+            if self.contains(neighbor):
+                yield neighbor
+
+    def find_all(self, value: int, /) -> Iterator[Location]:
+        for row_index in range(self.height):
+            start = row_index * self.stride
+            stop = start + self.width
+
+            index = self.cells.find(value, start, stop)
+            while index != -1:
+                yield (row_index, index - start)
+                index = self.cells.find(value, index + 1, stop)
+
+    def count(self, value: int, /) -> int:
+        if self.stride == self.width:
+            return self.cells.count(value)
+
+        return sum(
+            self.cells.count(value, row_index * self.stride, row_index * self.stride + self.width)
+            for row_index in range(self.height)
+        )
+
+    def copy(self) -> 'Grid':
+        return Grid(cells=bytearray(self.cells), height=self.height, width=self.width, stride=self.stride)
+
+    def compact(self) -> 'Grid':
+        if self.stride == self.width:
+            return self.copy()
+
+        return Grid(
+            cells=bytearray(b''.join(self.rows())),
+            height=self.height,
+            width=self.width,
+        )
+
+    def transpose(self) -> 'Grid':
+        return Grid(
+            cells=bytearray(b''.join(bytes(column) for column in self.columns())),
+            height=self.width,
+            width=self.height,
+        )
+
+    def rotate_clockwise(self) -> 'Grid':
+        return Grid(
+            cells=bytearray(b''.join(bytes(column[::-1]) for column in self.columns())),
+            height=self.width,
+            width=self.height,
+        )
+
+    # an immutable copy of the cells that can be hashed or used as a dictionary key
+    def snapshot(self) -> bytes:
+        if self.stride == self.width:
+            return bytes(self.cells[:self.height * self.width])
+
+        return b''.join(self.rows())
+
+    def __eq__(self, other: object, /) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return self.width == other.width and self.height == other.height and self.snapshot() == other.snapshot()
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, use snapshot() as a key instead
+
+    def __str__(self) -> str:
+        return '\n'.join(bytes(row).decode() for row in self.rows())
@@ -0,0 +1,173 @@
+from array import array
+import bisect
+from typing import Iterable, Iterator, List, Tuple
+
+# every interval is half-open, [start, end)
+Interval = Tuple[int, int]
+
+# stands in for minus infinity as the first breakpoint of every map
+MIN_BREAKPOINT = -(1 << 63)
+
+
+# disjoint intervals kept sorted in two parallel arrays; intervals that overlap or touch
+# are merged, so there is never more than one interval per gap between values
+class IntervalSet:
+    __slots__ = ('ends', 'starts')
+
+    def __init__(self, *, ends: 'array[int]', starts: 'array[int]') -> None:
+        self.ends = ends
+        self.starts = starts
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval], /) -> 'IntervalSet':
+        starts: 'array[int]' = array('q')
+        ends: 'array[int]' = array('q')
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+
+            if len(ends) > 0 and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return cls(ends=ends, starts=starts)
+
+    def __contains__(self, value: int, /) -> bool:
+        index = bisect.bisect_right(self.starts, value) - 1
+        return index >= 0 and value < self.ends[index]
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f'IntervalSet({list(self)})'
+
+    def min(self) -> int:
+        if len(self.starts) == 0:
+            raise Exception('empty interval set has no minimum')
+
+        return self.starts[0]
+
+    def size(self) -> int:
+        return sum(self.ends) - sum(self.starts)
+
+
+# a function that adds offsets[i] to every value from breakpoints[i] up to (but excluding)
+# breakpoints[i + 1]; the first breakpoint is MIN_BREAKPOINT, so every value is covered
+class PiecewiseLinearMap:
+    __slots__ = ('breakpoints', 'offsets')
+
+    def __init__(self, *, breakpoints: 'array[int]', offsets: 'array[int]') -> None:
+        self.breakpoints = breakpoints
+        self.offsets = offsets
+
+    @classmethod
+    def identity(cls) -> 'PiecewiseLinearMap':
+        return cls(breakpoints=array('q', [MIN_BREAKPOINT]), offsets=array('q', [0]))
+
+    # ranges are (destination_start, source_start, length), as in the d5 almanac; values
+    # outside every range map to themselves
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Tuple[int, int, int]], /) -> 'PiecewiseLinearMap':
+        pieces: List[Tuple[int, int]] = []
+        end = MIN_BREAKPOINT
+        for destination_start, source_start, length in sorted(ranges, key=lambda x: x[1]):
+            if length <= 0:
+                continue
+
+            if source_start < end:
+                raise Exception(f'range starting at {source_start} overlaps the previous one')
+
+            if source_start > end:
+                pieces.append((end, 0))
+
+            pieces.append((source_start, destination_start - source_start))
+            end = source_start + length
+
+        pieces.append((end, 0))
+
+        return cls._from_pieces(pieces)
+
+    # merges neighbouring pieces with the same offset
+    @classmethod
+    def _from_pieces(cls, pieces: Iterable[Tuple[int, int]], /) -> 'PiecewiseLinearMap':
+        breakpoints: 'array[int]' = array('q')
+        offsets: 'array[int]' = array('q')
+        for breakpoint, offset in pieces:
+            if len(offsets) > 0 and offsets[-1] == offset:
+                continue
+
+            breakpoints.append(breakpoint)
+            offsets.append(offset)
+
+        return cls(breakpoints=breakpoints, offsets=offsets)
+
+    def __len__(self) -> int:
+        return len(self.breakpoints)
+
+    def __repr__(self) -> str:
+        return f'PiecewiseLinearMap({list(zip(self.breakpoints, self.offsets))})'
+
+    # the map that applies self first and then other; the image of every piece of self is
+    # cut wherever it crosses a breakpoint of other
+    def then(self, other: 'PiecewiseLinearMap', /) -> 'PiecewiseLinearMap':
+        pieces: List[Tuple[int, int]] = []
+        for index, (start, offset) in enumerate(zip(self.breakpoints, self.offsets)):
+            other_index = bisect.bisect_right(other.breakpoints, start + offset) - 1
+            pieces.append((start, offset + other.offsets[other_index]))
+
+            if index + 1 < len(self.breakpoints):
+                other_end_index = bisect.bisect_left(other.breakpoints, self.breakpoints[index + 1] + offset)
+            else:
+                other_end_index = len(other.breakpoints)
+
+            for other_index in range(other_index + 1, other_end_index):
+                pieces.append((other.breakpoints[other_index] - offset, offset + other.offsets[other_index]))
+
+        return self._from_pieces(pieces)
+
+    def map_value(self, value: int, /) -> int:
+        return value + self.offsets[bisect.bisect_right(self.breakpoints, value) - 1]
+
+    # a bisect per value beats sorting the batch and sweeping it through the breakpoints,
+    # since bisect runs in C and the sweep would not
+    def map_values(self, values: Iterable[int], /) -> 'array[int]':
+        breakpoints = self.breakpoints
+        offsets = self.offsets
+        bisect_right = bisect.bisect_right
+
+        return array('q', (
+            value + offsets[bisect_right(breakpoints, value) - 1]
+            for value in values
+        ))
+
+    def map_intervals(self, intervals: IntervalSet, /) -> IntervalSet:
+        def generate_images() -> Iterator[Interval]:
+            for start, end in intervals:
+                index = bisect.bisect_right(self.breakpoints, start) - 1
+                while start < end:
+                    if index + 1 < len(self.breakpoints):
+                        piece_end = min(end, self.breakpoints[index + 1])
+                    else:
+                        piece_end = end
+
+                    offset = self.offsets[index]
+                    yield start + offset, piece_end + offset
+
+                    start = piece_end
+                    index += 1
+
+        return IntervalSet.from_intervals(generate_images())
+
+
+def compose(maps: Iterable[PiecewiseLinearMap], /) -> PiecewiseLinearMap:
+    composed = PiecewiseLinearMap.identity()
+    for map in maps:
+        composed = composed.then(map)
+
+    return composed
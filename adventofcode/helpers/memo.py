@@ -0,0 +1,157 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+import sys
+from typing import Any, Callable, Generic, Hashable, List, Optional, TypeVar
+
+
+R = TypeVar('R')
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+@dataclass(frozen=True, kw_only=True)
+class Statistics:
+    evictions: int
+    hits: int
+    misses: int
+    name: str
+    peak_entry_count: int
+
+
+def _measure_entry(key: Hashable, value: Any, /) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+# Remembers the results of a function, evicting the least recently used entries once
+# there are more than max_entries of them or, if max_bytes is given, once their measured
+# size exceeds it. The key defaults to every argument; pass a key function taking the same
+# arguments to normalise them, e.g. to the length of a suffix instead of the suffix itself.
+class Memo(Generic[R]):
+    def __init__(
+        self,
+        function: Callable[..., R],
+        /,
+        *,
+        key: Optional[Callable[..., Hashable]],
+        max_bytes: Optional[int],
+        max_entries: int,
+        measure: Callable[[Hashable, Any], int],
+    ) -> None:
+        functools.update_wrapper(self, function)
+
+        self.function = function
+        self.key = key
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.measure = measure
+        self.name = f'{function.__module__}.{function.__qualname__}'
+
+        self.total_bytes = 0
+        self.values: OrderedDict[Hashable, R] = OrderedDict()
+
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.peak_entry_count = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        if self.key is None:
+            key: Hashable = (args, tuple(sorted(kwargs.items())))
+        else:
+            key = self.key(*args, **kwargs)
+
+        try:
+            value = self.values[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self.values.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.function(*args, **kwargs)
+        self._put(key, value)
+
+        return value
+
+    def _put(self, key: Hashable, value: R, /) -> None:
+        self.values[key] = value
+        if self.max_bytes is not None:
+            self.total_bytes += self.measure(key, value)
+
+        while len(self.values) > self.max_entries or (self.max_bytes is not None and self.total_bytes > self.max_bytes):
+            evicted_key, evicted_value = self.values.popitem(last=False)
+            if self.max_bytes is not None:
+                self.total_bytes -= self.measure(evicted_key, evicted_value)
+
+            self.evictions += 1
+
+        self.peak_entry_count = max(self.peak_entry_count, len(self.values))
+
+    # forgets every remembered value but keeps the counters
+    def clear(self) -> None:
+        self.values.clear()
+        self.total_bytes = 0
+
+    def reset(self) -> None:
+        self.clear()
+
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.peak_entry_count = 0
+
+    def get_statistics(self) -> Statistics:
+        return Statistics(
+            evictions=self.evictions,
+            hits=self.hits,
+            misses=self.misses,
+            name=self.name,
+            peak_entry_count=self.peak_entry_count,
+        )
+
+
+_memos: List[Memo[Any]] = []
+
+
+def memoize(
+    *,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_bytes: Optional[int] = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    measure: Callable[[Hashable, Any], int] = _measure_entry,
+) -> Callable[[Callable[..., R]], Memo[R]]:
+    def decorate(function: Callable[..., R], /) -> Memo[R]:
+        memo = Memo(
+            function,
+            key=key,
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            measure=measure,
+        )
+        _memos.append(memo)
+
+        return memo
+
+    return decorate
+
+
+# the executor calls this after every input, so no memo outlives the input it was filled for
+def clear_all() -> None:
+    for memo in _memos:
+        memo.clear()
+
+
+def reset_all() -> None:
+    for memo in _memos:
+        memo.reset()
+
+
+def collect_statistics() -> List[Statistics]:
+    return [
+        memo.get_statistics()
+        for memo in _memos
+        if memo.hits + memo.misses > 0
+    ]
@@ -1,5 +1,15 @@
+import hashlib
+import os
+import pickle
+import re
+import sys
+import types
+from typing import Any, Dict, Set
+
 import parsy
 
+from adventofcode.helpers import cache, paths, profiling
+
 
 NEWLINE = parsy.string('\n')
 NEWLINES = NEWLINE.at_least(1)
@@ -9,3 +19,103 @@ SPACES = SPACE.at_least(1)
 
 NUMBER = parsy.regex(r'-?\d+').map(int)
 NUMBER_LIST = NUMBER.sep_by(SPACES)
+
+
+PARSE_CACHE_ENVIRONMENT_VARIABLE = 'AOC_PARSE_CACHE'
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PARSE_DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+_pickled_values_by_key: cache.LruCache[bytes] = cache.LruCache(
+    max_bytes=PARSE_CACHE_MAX_BYTES,
+    measure=len,
+)
+_disk_cache = cache.DiskCache(
+    directory_path=paths.CACHE_DIRECTORY_PATH / 'parsed',
+    max_bytes=PARSE_DISK_CACHE_MAX_BYTES,
+    suffix='.pickle',
+)
+_fingerprints_by_grammar_id: Dict[int, bytes] = {}
+
+
+def _update_fingerprint(value: Any, /, *, hasher: Any, seen: Set[int]) -> None:
+    if isinstance(value, parsy.Parser):
+        if id(value) in seen:
+            hasher.update(b'<cycle>')
+            return
+
+        seen.add(id(value))
+        hasher.update(b'<parser>')
+        _update_fingerprint(vars(value), hasher=hasher, seen=seen)
+    elif isinstance(value, types.FunctionType):
+        hasher.update(b'<function>')
+        _update_fingerprint(value.__code__, hasher=hasher, seen=seen)
+        _update_fingerprint(value.__defaults__, hasher=hasher, seen=seen)
+        _update_fingerprint(value.__kwdefaults__, hasher=hasher, seen=seen)
+        for cell in value.__closure__ or ():
+            _update_fingerprint(cell.cell_contents, hasher=hasher, seen=seen)
+    elif isinstance(value, (types.BuiltinMethodType, types.MethodType)):
+        # e.g. ''.join from .concat(); the default repr would include a memory address
+        hasher.update(f'<method {value.__qualname__}>'.encode())
+        if not isinstance(value.__self__, types.ModuleType):
+            _update_fingerprint(value.__self__, hasher=hasher, seen=seen)
+    elif isinstance(value, types.CodeType):
+        hasher.update(b'<code>')
+        hasher.update(value.co_code)
+        hasher.update(repr(value.co_names).encode())
+        _update_fingerprint(value.co_consts, hasher=hasher, seen=seen)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f'<{type(value).__name__} {len(value)}>'.encode())
+        for item in value:
+            _update_fingerprint(item, hasher=hasher, seen=seen)
+    elif isinstance(value, dict):
+        hasher.update(f'<dict {len(value)}>'.encode())
+        for key, item in sorted(value.items(), key=lambda x: repr(x[0])):
+            hasher.update(repr(key).encode())
+            _update_fingerprint(item, hasher=hasher, seen=seen)
+    elif isinstance(value, re.Pattern):
+        hasher.update(f'<pattern {value.pattern!r} {value.flags}>'.encode())
+    else:
+        hasher.update(repr(value).encode())
+
+
+# identifies a grammar by its structure, so identical grammars defined in both parts
+# of a day share cache entries while any change to a grammar invalidates them
+def fingerprint(grammar: parsy.Parser, /) -> bytes:
+    cached = _fingerprints_by_grammar_id.get(id(grammar))
+    if cached is not None:
+        return cached
+
+    hasher = hashlib.sha256()
+    hasher.update(f'{sys.version_info[:2]} parsy {parsy.__version__}'.encode())
+    _update_fingerprint(grammar, hasher=hasher, seen=set())
+
+    # grammars are module level constants, so their ids are never reused
+    _fingerprints_by_grammar_id[id(grammar)] = hasher.digest()
+    return _fingerprints_by_grammar_id[id(grammar)]
+
+
+def is_parse_cache_enabled() -> bool:
+    return os.environ.get(PARSE_CACHE_ENVIRONMENT_VARIABLE, '1') not in ('', '0')
+
+
+# equivalent to grammar.parse(content), but remembers the result in memory and on disk;
+# every call unpickles a fresh copy so callers are free to mutate what they get back.
+# Timed runs always parse, since a cache hit never reaches the grammar and would be
+# billed to solving instead
+def parse(grammar: parsy.Parser, content: str, /) -> Any:
+    if not is_parse_cache_enabled() or profiling.is_timing_enabled():
+        return grammar.parse(content)
+
+    key = hashlib.sha256(fingerprint(grammar) + content.encode()).hexdigest()
+
+    pickled_value = _pickled_values_by_key.get(key)
+    if pickled_value is None:
+        pickled_value = _disk_cache.get(key)
+
+        if pickled_value is None:
+            pickled_value = pickle.dumps(grammar.parse(content), protocol=pickle.HIGHEST_PROTOCOL)
+            _disk_cache.put(key, pickled_value)
+
+        _pickled_values_by_key.put(key, pickled_value)
+
+    return pickle.loads(pickled_value)
@@ -20,3 +20,4 @@ def _find_source_directory_path() -> Path:
 
 SOURCE_DIRECTORY_PATH = _find_source_directory_path()
 PROJECT_DIRECTORY_PATH = SOURCE_DIRECTORY_PATH.parent
+CACHE_DIRECTORY_PATH = PROJECT_DIRECTORY_PATH / '.cache'
@@ -0,0 +1,165 @@
+import contextlib
+import cProfile
+from dataclasses import dataclass
+import io
+import os
+from pathlib import Path
+import pstats
+import time
+import tracemalloc
+from typing import Any, Iterator, Optional, Sequence
+
+import parsy
+
+from adventofcode.helpers import memo, paths, registry
+from adventofcode.helpers.grid import Grid
+
+
+TIMING_ENVIRONMENT_VARIABLE = 'AOC_TIMING'
+MEMORY_ENVIRONMENT_VARIABLE = 'AOC_MEMORY'
+PROFILE_ENVIRONMENT_VARIABLE = 'AOC_PROFILE'
+
+PROFILES_DIRECTORY_PATH = paths.CACHE_DIRECTORY_PATH / 'profiles'
+
+
+@dataclass(frozen=True, kw_only=True)
+class Timings:
+    memo_statistics: Sequence[memo.Statistics]
+    parse_ns: int
+    read_ns: int
+    solve_ns: int  # excludes time spent parsing
+    write_ns: int
+
+
+class Stopwatch:
+    def __init__(self) -> None:
+        self.elapsed_ns = 0
+
+    @contextlib.contextmanager
+    def measure(self) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.elapsed_ns += time.perf_counter_ns() - start
+
+
+def _is_enabled(*, name: str) -> bool:
+    return os.environ.get(name, '') not in ('', '0')
+
+
+def is_timing_enabled() -> bool:
+    return _is_enabled(name=TIMING_ENVIRONMENT_VARIABLE)
+
+
+def is_memory_tracing_enabled() -> bool:
+    return _is_enabled(name=MEMORY_ENVIRONMENT_VARIABLE)
+
+
+def is_profiling_enabled() -> bool:
+    return _is_enabled(name=PROFILE_ENVIRONMENT_VARIABLE)
+
+
+@contextlib.contextmanager
+def measure_parsing(stopwatch: Stopwatch, /) -> Iterator[None]:
+    # every grammar is run through parsy.Parser.parse and every character grid through
+    # Grid.from_content, so timing both separates the cost of parsing from the cost of
+    # the algorithm without touching each day
+    original_parse = parsy.Parser.parse
+    original_from_content = Grid.from_content
+    original_from_content_descriptor = Grid.__dict__['from_content']
+
+    def parse(self: parsy.Parser, stream: str) -> Any:
+        with stopwatch.measure():
+            return original_parse(self, stream)
+
+    def from_content(content: str, /, **kwargs: Any) -> Grid:
+        with stopwatch.measure():
+            return original_from_content(content, **kwargs)
+
+    parsy.Parser.parse = parse
+    setattr(Grid, 'from_content', staticmethod(from_content))
+    try:
+        yield
+    finally:
+        parsy.Parser.parse = original_parse
+        setattr(Grid, 'from_content', original_from_content_descriptor)
+
+
+class MemoryTrace:
+    def __init__(self) -> None:
+        self.peak_bytes = 0
+
+
+@contextlib.contextmanager
+def trace_memory() -> Iterator[MemoryTrace]:
+    memory_trace = MemoryTrace()
+    tracemalloc.start()
+    try:
+        yield memory_trace
+    finally:
+        _, memory_trace.peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+
+def find_profile_path(*, is_example: bool, solution: registry.Solution) -> Path:
+    descriptor = 'example' if is_example else 'actual'
+    return PROFILES_DIRECTORY_PATH / f'{solution.name}_{descriptor}.pstats'
+
+
+# filled in once the profiled block exits; nothing is printed here because the block may
+# run in a worker process, so the parent prints the summary along with the result
+class ProfileTrace:
+    def __init__(self) -> None:
+        self.path: Optional[Path] = None
+        self.summary = ''
+
+
+@contextlib.contextmanager
+def profile(*, is_example: bool, solution: registry.Solution) -> Iterator[ProfileTrace]:
+    profile_trace = ProfileTrace()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profile_trace
+    finally:
+        profiler.disable()
+
+        path = find_profile_path(is_example=is_example, solution=solution)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(10)
+
+        profile_trace.path = path
+        profile_trace.summary = summary.getvalue()
+
+
+def _format_nanoseconds(value: int, /) -> str:
+    return f'{value / 1_000_000:.3f}ms'
+
+
+def print_timings(timings: Timings, /) -> None:
+    print(f'read:  {_format_nanoseconds(timings.read_ns)}')
+    print(f'parse: {_format_nanoseconds(timings.parse_ns)}')
+    print(f'solve: {_format_nanoseconds(timings.solve_ns)}')
+    print(f'write: {_format_nanoseconds(timings.write_ns)}')
+
+    for statistics in timings.memo_statistics:
+        print(
+            f'memo {statistics.name}: {statistics.hits} hits, {statistics.misses} misses, '
+            f'{statistics.evictions} evictions, {statistics.peak_entry_count} peak entries'
+        )
+
+    print()
+
+
+def print_peak_memory(peak_memory_bytes: int, /) -> None:
+    print(f'peak memory: {peak_memory_bytes / 1024:.1f}KiB')
+    print()
+
+
+def print_profile(profile_trace: ProfileTrace, /) -> None:
+    print(f'Wrote profile to {profile_trace.path}')
+    print(profile_trace.summary)
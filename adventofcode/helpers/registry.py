@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Sequence
+
+from adventofcode.helpers import resources
+
+
+MODULE_NAME_PATTERN = re.compile(r'adventofcode\.y(\d+)\.d(\d+)\.p(\d+)')
+
+Consumer = Callable[[str], Any]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Solution:
+    consumer: Consumer
+    day: int
+    module_name: str
+    part: int
+    resources_directory_path: Path
+    year: int
+
+    @property
+    def name(self) -> str:
+        return f'{self.year}_{self.day}_{self.part}'
+
+
+SOLUTIONS_BY_MODULE_NAME: Dict[str, Solution] = {}
+
+
+def register(consumer: Consumer, /) -> Consumer:
+    module_name = consumer.__module__
+
+    match = MODULE_NAME_PATTERN.fullmatch(module_name)
+    if match is None:
+        raise Exception(f'expected a solution module like adventofcode.y2023.d1.p1, got {module_name}')
+
+    year, day, part = match.groups()
+    SOLUTIONS_BY_MODULE_NAME[module_name] = Solution(
+        consumer=consumer,
+        day=int(day),
+        module_name=module_name,
+        part=int(part),
+        resources_directory_path=resources.RESOURCES_DIRECTORY_PATH.joinpath(*module_name.split('.')[1:]),
+        year=int(year),
+    )
+
+    return consumer
+
+
+def find(consumer: Consumer, /) -> Solution:
+    solution = SOLUTIONS_BY_MODULE_NAME.get(consumer.__module__)
+    if solution is None or solution.consumer is not consumer:
+        raise Exception(f'expected {consumer.__module__}.{consumer.__name__} to be decorated with registry.register')
+
+    return solution
+
+
+def get_solutions() -> Sequence[Solution]:
+    return sorted(
+        SOLUTIONS_BY_MODULE_NAME.values(),
+        key=lambda x: (x.year, x.day, x.part),
+    )
@@ -1,73 +1,129 @@
+import functools
+import mmap
 from pathlib import Path
+from typing import Tuple
 
-from adventofcode.helpers import file, paths
+from adventofcode.helpers import cache, file, paths
 
 
 RESOURCES_DIRECTORY_PATH = paths.PROJECT_DIRECTORY_PATH / 'resources'
 
+INPUT_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
-def _find_resources_directory_path(*, code_path: Path) -> Path:
-    path_relative_to_source = code_path.relative_to(paths.SOURCE_DIRECTORY_PATH)
-    return RESOURCES_DIRECTORY_PATH / path_relative_to_source.parent
+# (st_mtime_ns, st_size) of the file when it was cached
+Stamp = Tuple[int, int]
 
+_contents_by_path: cache.LruCache[Tuple[Stamp, str]] = cache.LruCache(
+    max_bytes=INPUT_CACHE_MAX_BYTES,
+    measure=lambda x: len(x[1]),
+)
 
-def _find_input_directory_path(*, code_path: Path) -> Path:
-    return _find_resources_directory_path(code_path=code_path) / 'in'
 
+# both parts of a day usually share an input, so the lookup is only done once per directory
+@functools.lru_cache(maxsize=None)
+def _find_input_file_path(*, directory_path: Path, filename: str) -> Path:
+    # inputs shared by both parts live in the day's directory rather than the part's
+    path = directory_path / 'in' / filename
+    while not path.is_file():
+        if directory_path == RESOURCES_DIRECTORY_PATH or paths.is_root(path=directory_path):
+            raise Exception('failed to find input file')
 
-def _find_output_directory_path(*, code_path: Path) -> Path:
-    return _find_resources_directory_path(code_path=code_path) / 'out'
+        directory_path = directory_path.parent
+        path = directory_path / 'in' / filename
 
+    return path
 
-def _read_input_file(*, code_path: Path, filename: str) -> str:
-    while True:
-        path = _find_input_directory_path(code_path=code_path) / filename
-        if paths.is_root(path=path):
-            raise Exception('failed to find input file')
 
-        if path.is_file():
-            break
+def _stamp(*, path: Path) -> Stamp:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_input_file(*, directory_path: Path, filename: str) -> str:
+    path = _find_input_file_path(directory_path=directory_path, filename=filename)
+    stamp = _stamp(path=path)
+
+    cached = _contents_by_path.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
-        code_path = code_path.parent
+    content = file.read_content(path=path)
+    _contents_by_path.put(path, (stamp, content))
 
-    return file.read_content(path=path)
+    return content
+
+
+def _map_input_file(*, directory_path: Path, filename: str) -> mmap.mmap:
+    path = _find_input_file_path(directory_path=directory_path, filename=filename)
+    return file.map_content(path=path)
+
+
+def _read_output_file(*, directory_path: Path, filename: str) -> str:
+    path = directory_path / 'out' / filename
+    return file.read_content(path=path).removesuffix('\n')
 
 
 # returns output file path
-def _write_output_file(*, code_path: Path, content: str, filename: str) -> Path:
-    path = _find_output_directory_path(code_path=code_path) / filename
+def _write_output_file(*, content: str, directory_path: Path, filename: str) -> Path:
+    path = directory_path / 'out' / filename
     file.write(content=content, path=path)
 
     return path
 
 
-def read_example(*, code_path: str) -> str:
+def read_example(*, directory_path: Path) -> str:
     return _read_input_file(
-        code_path=Path(code_path),
+        directory_path=directory_path,
         filename='example.txt',
     )
 
 
-def read_actual(*, code_path: str) -> str:
+def read_actual(*, directory_path: Path) -> str:
     return _read_input_file(
-        code_path=Path(code_path),
+        directory_path=directory_path,
+        filename='actual.txt',
+    )
+
+
+# returns a new read-only memory map of the raw bytes, for inputs too large to copy
+# around; nothing keeps it open, so close it once done
+def map_example(*, directory_path: Path) -> mmap.mmap:
+    return _map_input_file(
+        directory_path=directory_path,
+        filename='example.txt',
+    )
+
+
+# returns a new read-only memory map of the raw bytes, for inputs too large to copy
+# around; nothing keeps it open, so close it once done
+def map_actual(*, directory_path: Path) -> mmap.mmap:
+    return _map_input_file(
+        directory_path=directory_path,
+        filename='actual.txt',
+    )
+
+
+# returns the previously written actual result
+def read_actual_result(*, directory_path: Path) -> str:
+    return _read_output_file(
+        directory_path=directory_path,
         filename='actual.txt',
     )
 
 
 # returns output file path
-def write_example(*, code_path: str, content: str) -> Path:
+def write_example(*, content: str, directory_path: Path) -> Path:
     return _write_output_file(
-        code_path=Path(code_path),
         content=content,
+        directory_path=directory_path,
         filename='example.txt',
     )
 
 
 # returns output file path
-def write_actual(*, code_path: str, content: str) -> Path:
+def write_actual(*, content: str, directory_path: Path) -> Path:
     return _write_output_file(
-        code_path=Path(code_path),
         content=content,
+        directory_path=directory_path,
         filename='actual.txt',
     )
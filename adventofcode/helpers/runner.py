@@ -0,0 +1,192 @@
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import importlib
+import os
+import pkgutil
+import time
+from typing import Dict, Sequence, Tuple
+
+import adventofcode
+from adventofcode.helpers import executor, profiling, registry
+
+
+@dataclass(frozen=True, kw_only=True)
+class Task:
+    is_example: bool
+    solution: registry.Solution
+
+
+@dataclass(frozen=True, kw_only=True)
+class Outcome:
+    answer: executor.Answer
+    seconds: float
+    task: Task
+
+
+@dataclass(frozen=True, kw_only=True)
+class Timing:
+    actual_seconds: float
+    example_seconds: float
+    solution: registry.Solution
+
+
+def find_solutions() -> Sequence[registry.Solution]:
+    # importing a solution module registers its solution
+    for module_info in pkgutil.walk_packages(adventofcode.__path__, prefix='adventofcode.'):
+        if registry.MODULE_NAME_PATTERN.fullmatch(module_info.name) is not None:
+            importlib.import_module(module_info.name)
+
+    return registry.get_solutions()
+
+
+def create_tasks(*, solutions: Sequence[registry.Solution]) -> Sequence[Task]:
+    return tuple(
+        Task(is_example=is_example, solution=solution)
+        for solution in solutions
+        for is_example in (True, False)
+    )
+
+
+# must stay a module level function so that it can be pickled for worker processes
+def run_task(task: Task, /) -> Outcome:
+    start = time.perf_counter()
+    answer = executor.solve(task.solution, is_example=task.is_example)
+    seconds = time.perf_counter() - start
+
+    return Outcome(
+        answer=answer,
+        seconds=seconds,
+        task=task,
+    )
+
+
+def record_outcome(outcome: Outcome, /) -> None:
+    executor.record(
+        answer=outcome.answer,
+        is_example=outcome.task.is_example,
+        solution=outcome.task.solution,
+    )
+
+
+def run_tasks(*, jobs: int, tasks: Sequence[Task]) -> Sequence[Outcome]:
+    if jobs == 1:
+        outcomes = []
+        for task in tasks:
+            outcome = run_task(task)
+            record_outcome(outcome)
+            outcomes.append(outcome)
+
+        return outcomes
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures: Sequence[Future[Outcome]] = [
+            pool.submit(run_task, task)
+            for task in tasks
+        ]
+
+        # wait on the futures in submission order so output is deterministic
+        outcomes = []
+        for future in futures:
+            outcome = future.result()
+            record_outcome(outcome)
+            outcomes.append(outcome)
+
+        return outcomes
+
+
+def calculate_timings(*, outcomes: Sequence[Outcome]) -> Sequence[Timing]:
+    seconds_by_key: Dict[Tuple[str, bool], float] = {
+        (outcome.task.solution.name, outcome.task.is_example): outcome.seconds
+        for outcome in outcomes
+    }
+    solutions_by_name = {
+        outcome.task.solution.name: outcome.task.solution
+        for outcome in outcomes
+    }
+
+    return tuple(
+        Timing(
+            actual_seconds=seconds_by_key.get((name, False), 0.0),
+            example_seconds=seconds_by_key.get((name, True), 0.0),
+            solution=solution,
+        )
+        for name, solution in solutions_by_name.items()
+    )
+
+
+def print_timings(timings: Sequence[Timing], /, *, wall_seconds: float) -> None:
+    print(f'{"solution":<12}{"example":>12}{"actual":>12}{"total":>12}')
+    print('-' * 48)
+
+    for timing in timings:
+        total_seconds = timing.example_seconds + timing.actual_seconds
+
+        print(f'{timing.solution.name:<12}{timing.example_seconds:>11.3f}s{timing.actual_seconds:>11.3f}s{total_seconds:>11.3f}s')
+
+    total_seconds = sum(
+        timing.example_seconds + timing.actual_seconds
+        for timing in timings
+    )
+
+    print('-' * 48)
+    print(f'{"total":<12}{total_seconds:>35.3f}s')
+    print(f'{"wall":<12}{wall_seconds:>35.3f}s')
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run every solution in a single process.')
+    parser.add_argument(
+        '--jobs',
+        default=1,
+        help='number of worker processes to spread the solutions over',
+        type=int,
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='recompute every result even if its source and input are unchanged',
+    )
+    parser.add_argument(
+        '--timing',
+        action='store_true',
+        help='report read, parse, solve and write times for every execution',
+    )
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='report the peak memory of every execution, traced on a run of its own',
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=f'dump a cProfile for every execution into {profiling.PROFILES_DIRECTORY_PATH}',
+    )
+
+    arguments = parser.parse_args()
+    if arguments.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    return arguments
+
+
+def main():
+    arguments = parse_arguments()
+
+    # set through the environment so that worker processes inherit them
+    if arguments.force:
+        os.environ[executor.FORCE_ENVIRONMENT_VARIABLE] = '1'
+    if arguments.timing:
+        os.environ[profiling.TIMING_ENVIRONMENT_VARIABLE] = '1'
+    if arguments.memory:
+        os.environ[profiling.MEMORY_ENVIRONMENT_VARIABLE] = '1'
+    if arguments.profile:
+        os.environ[profiling.PROFILE_ENVIRONMENT_VARIABLE] = '1'
+
+    tasks = create_tasks(solutions=find_solutions())
+
+    start = time.perf_counter()
+    outcomes = run_tasks(jobs=arguments.jobs, tasks=tasks)
+    wall_seconds = time.perf_counter() - start
+
+    print_timings(calculate_timings(outcomes=outcomes), wall_seconds=wall_seconds)
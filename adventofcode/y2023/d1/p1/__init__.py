@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from adventofcode.helpers import executor
+from adventofcode.helpers import executor, registry
 
 
 def find_first_digit(*, line: str) -> int:
@@ -27,6 +27,7 @@ def calculate_value(*, line: str) -> int:
     return (10 * first_digit) + last_digit
 
 
+@registry.register
 def solution(content: str, /) -> str:
     return sum(
         calculate_value(line=line)
@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from adventofcode.helpers import executor
+from adventofcode.helpers import executor, registry
 
 
 DIGITS_BY_WORD = {
@@ -51,6 +51,7 @@ def calculate_value(*, line: str) -> int:
     return (10 * first_digit) + last_digit
 
 
+@registry.register
 def solution(content: str, /) -> int:
     return sum(
         calculate_value(line=line)
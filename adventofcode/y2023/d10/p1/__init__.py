@@ -1,171 +1,112 @@
+from array import array
 from dataclasses import dataclass
-import math
-import parsy
-from typing import Sequence, Tuple, Optional
-
-from adventofcode.helpers import executor, parsers
-
-import sys
-print(sys.setrecursionlimit(16_000))
-
-PIPE = parsy.regex(r'[\|\-LJ7F\.S]')
-
-CONTENT = (
-    PIPE.at_least(1).concat()
-    .sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
+from typing import Tuple
+
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid, Location
+
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTION_COUNT = 4
+NO_DIRECTION = DIRECTION_COUNT
+
+# the sides of a cell a pipe connects, as a mask with a bit per direction; '.', 'S' and
+# the newlines between rows connect nothing
+CONNECTIONS_BY_CHARACTER = {
+    ord('|'): 1 << UP | 1 << DOWN,
+    ord('-'): 1 << LEFT | 1 << RIGHT,
+    ord('L'): 1 << UP | 1 << RIGHT,
+    ord('J'): 1 << UP | 1 << LEFT,
+    ord('7'): 1 << DOWN | 1 << LEFT,
+    ord('F'): 1 << DOWN | 1 << RIGHT,
+}
+CONNECTIONS = bytes(CONNECTIONS_BY_CHARACTER.get(character, 0) for character in range(256))
+
+
+def find_next_direction(*, connections: int, direction: int) -> int:
+    entry = 1 << (direction + 2) % DIRECTION_COUNT
+    exits = connections ^ entry
+    if connections & entry == 0 or exits.bit_count() != 1:
+        return NO_DIRECTION
+
+    return exits.bit_length() - 1
+
+
+# the direction a loop leaves a cell in, by connections * DIRECTION_COUNT + the direction
+# it entered in, or NO_DIRECTION if the pipe does not connect to the side it came from
+NEXT_DIRECTIONS = bytes(
+    find_next_direction(connections=connections, direction=direction)
+    for connections in range(1 << DIRECTION_COUNT)
+    for direction in range(DIRECTION_COUNT)
 )
 
 
 @dataclass(frozen=True, kw_only=True)
-class Pipe:
-    directions: Tuple[str, str]
+class Sketch:
+    connections: bytes  # a mask per cell, laid out like pipes.cells
+    pipes: Grid
+    start: Location
 
 
 @dataclass(frozen=True, kw_only=True)
-class Grid:
-    pipes: Sequence[Sequence[Optional[Pipe]]]
-    start: Tuple[int, int]
-
-
-def parse_grid(*, content: str) -> Grid:
-    grid = CONTENT.parse(content)
-
-    pipes = []
-    start = None
-    for row_index, line in enumerate(grid):
-        pipe_row = []
-
-        for column_index, pipe in enumerate(line):
-            value: Optional[Pipe]
-            match pipe:
-                case '|':
-                    value = Pipe(directions=('up', 'down'))
-                case '-':
-                    value = Pipe(directions=('left', 'right'))
-                case 'L':
-                    value = Pipe(directions=('up', 'right'))
-                case 'J':
-                    value = Pipe(directions=('up', 'left'))
-                case '7':
-                    value = Pipe(directions=('down', 'left'))
-                case 'F':
-                    value = Pipe(directions=('down', 'right'))
-                case '.':
-                    value = None
-                case 'S':
-                    value = None
-                    if start is not None:
-                        raise Exception('expected a single start character')
-
-                    start = (row_index, column_index)
-                case _:
-                    raise Exception(f'unexpected character: {pipe}')
-
-            pipe_row.append(value)
-
-        pipes.append(pipe_row)
-
-    if start is None:
+class Loop:
+    cells: array  # the cell indices in the order they are walked, starting at the start
+    directions: bytes  # the direction the loop leaves each of those cells in
+
+
+def parse_sketch(*, content: str) -> Sketch:
+    # the newlines stay in the grid and connect nothing, so a loop can never walk off a row
+    pipes = Grid.from_content(content, alphabet=b'|-LJ7F.S')
+
+    starts = tuple(pipes.find_all(ord('S')))
+    if len(starts) != 1:
         raise Exception('expected a single start character')
 
-    return Grid(pipes=pipes, start=start)
-
-
-def get_next_location(*, grid: Grid, location: Tuple[int, int], direction: str) -> Optional[Tuple[int, int]]:
-    current_row_index, current_column_index = location
-    match direction:
-        case 'up':
-            next_location = (current_row_index - 1, current_column_index)
-        case 'down':
-            next_location = (current_row_index + 1, current_column_index)
-        case 'left':
-            next_location = (current_row_index, current_column_index - 1)
-        case 'right':
-            next_location = (current_row_index, current_column_index + 1)
-        case _:
-            raise Exception(f'unexpected direction: {direction}')
-
-    next_row_index, next_column_index = next_location
-    if next_row_index < 0:
-        return None
-    if next_row_index > len(grid.pipes):
-        return None
-
-    if next_column_index < 0:
-        return None
-    if next_column_index > len(grid.pipes[0]):
-        return None
-
-    return next_location
-
-
-def find_distance_to_start(*, current_location: Tuple[int, int], grid: Grid, last_direction: str) -> Optional[int]:
-    if current_location == grid.start:
-        return 0
-
-    current_row_index, current_column_index = current_location
-    pipe = grid.pipes[current_row_index][current_column_index]
-
-    if pipe is None:
-        return None
-
-    match last_direction:
-        case 'up':
-            expected_direction = 'down'
-        case 'down':
-            expected_direction = 'up'
-        case 'left':
-            expected_direction = 'right'
-        case 'right':
-            expected_direction = 'left'
-        case _:
-            raise Exception(f'unexpected direction: {last_direction}')
-
-    try:
-        index = pipe.directions.index(expected_direction)
-    except ValueError:
-        return None
-
-    next_direction = pipe.directions[(index + 1) % 2]
-    next_location = get_next_location(
-        grid=grid,
-        location=current_location,
-        direction=next_direction,
+    return Sketch(
+        connections=pipes.cells.translate(CONNECTIONS),
+        pipes=pipes,
+        start=starts[0],
     )
 
-    distance_to_start = find_distance_to_start(
-        current_location=next_location,
-        grid=grid,
-        last_direction=next_direction,
-    )
-    if distance_to_start is None:
-        return None
 
-    return distance_to_start + 1
+def find_offsets(*, sketch: Sketch) -> Tuple[int, int, int, int]:
+    return (-sketch.pipes.stride, 1, sketch.pipes.stride, -1)
 
 
+# tries each direction out of the start in turn until one leads back to it
+def trace_loop(*, sketch: Sketch) -> Loop:
+    connections = sketch.connections
+    offsets = find_offsets(sketch=sketch)
+    start = sketch.pipes.index(sketch.start)
+
+    for start_direction in range(DIRECTION_COUNT):
+        cells = array('i', [start])
+        directions = bytearray([start_direction])
+
+        direction = start_direction
+        cell = start + offsets[direction]
+        while cell != start:
+            if not 0 <= cell < len(connections):
+                break
+
+            direction = NEXT_DIRECTIONS[connections[cell] * DIRECTION_COUNT + direction]
+            if direction == NO_DIRECTION:
+                break
+
+            cells.append(cell)
+            directions.append(direction)
+            cell += offsets[direction]
+        else:
+            return Loop(cells=cells, directions=bytes(directions))
+
+    raise Exception('expected a loop through the start')
+
+
+@registry.register
 def solution(content: str, /) -> int:
-    grid = parse_grid(content=content)
-
-    for direction in ['up', 'down', 'left', 'right']:
-        location = get_next_location(
-            grid=grid,
-            location=grid.start,
-            direction=direction,
-        )
-
-        if location is None:
-            continue
-
-        distance_to_start = find_distance_to_start(
-            current_location=location,
-            grid=grid,
-            last_direction=direction,
-        )
-
-        if distance_to_start is not None:
-            return math.ceil(distance_to_start / 2)
+    sketch = parse_sketch(content=content)
+    loop = trace_loop(sketch=sketch)
+
+    return len(loop.cells) // 2
 
 
 def main():
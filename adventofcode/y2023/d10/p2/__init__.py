@@ -1,315 +1,118 @@
-from dataclasses import dataclass
-import parsy
-from typing import Sequence, Tuple, Optional, Literal, Union, Set
+from array import array
+from typing import Tuple
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, registry
+from adventofcode.y2023.d10 import p1
 
-PIPE = parsy.regex(r'[\|\-LJ7F\.S]')
 
-CONTENT = (
-    PIPE.at_least(1).concat()
-    .sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
+# the same loop walked the other way round, still starting at the start
+def reverse_loop(*, loop: p1.Loop) -> p1.Loop:
+    cells = array('i', [loop.cells[0]])
+    cells.extend(reversed(loop.cells[1:]))
 
-Location = Tuple[int, int]
-Direction = Union[
-    Literal['up'],
-    Literal['down'],
-    Literal['left'],
-    Literal['right'],
-]
-
-
-@dataclass(frozen=True, kw_only=True)
-class Pipe:
-    directions: Tuple[Direction, Direction]
-
-
-@dataclass(frozen=True, kw_only=True)
-class Grid:
-    pipes: Sequence[Sequence[Optional[Pipe]]]
-    start: Location
-
-
-@dataclass(frozen=True, kw_only=True)
-class Step:
-    direction: Direction
-    location: Location
-
-
-@dataclass(frozen=True, kw_only=True)
-class Path:
-    steps: Sequence[Step]
-
-
-def parse_grid(*, content: str) -> Grid:
-    grid = CONTENT.parse(content)
-
-    pipes = []
-    start = None
-    for row_index, line in enumerate(grid):
-        pipe_row = []
-
-        for column_index, pipe in enumerate(line):
-            value: Optional[Pipe]
-            match pipe:
-                case '|':
-                    value = Pipe(directions=('up', 'down'))
-                case '-':
-                    value = Pipe(directions=('left', 'right'))
-                case 'L':
-                    value = Pipe(directions=('up', 'right'))
-                case 'J':
-                    value = Pipe(directions=('up', 'left'))
-                case '7':
-                    value = Pipe(directions=('down', 'left'))
-                case 'F':
-                    value = Pipe(directions=('down', 'right'))
-                case '.':
-                    value = None
-                case 'S':
-                    value = None
-                    if start is not None:
-                        raise Exception('expected a single start character')
-
-                    start = (row_index, column_index)
-                case _:
-                    raise Exception(f'unexpected character: {pipe}')
-
-            pipe_row.append(value)
-
-        pipes.append(pipe_row)
-
-    if start is None:
-        raise Exception('expected a single start character')
-
-    return Grid(pipes=pipes, start=start)
-
-
-def invert_direction(*, direction: Direction) -> Direction:
-    match direction:
-        case 'up':
-            return 'down'
-        case 'down':
-            return 'up'
-        case 'left':
-            return 'right'
-        case 'right':
-            return 'left'
-        case _:
-            raise Exception(f'unexpected direction: {direction}')
-
-
-def calculate_next_location(*, step: Step) -> Location:
-    difference: Tuple[int, int]
-    match step.direction:
-        case 'up':
-            difference = (-1, 0)
-        case 'down':
-            difference = (1, 0)
-        case 'left':
-            difference = (0, -1)
-        case 'right':
-            difference = (0, 1)
-        case _:
-            raise Exception(f'unexpected direction: {step.direction}')
-
-    return (
-        step.location[0] + difference[0],
-        step.location[1] + difference[1],
+    directions = bytes(
+        (direction + 2) % p1.DIRECTION_COUNT
+        for direction in reversed(loop.directions)
     )
 
-
-def is_location_in_grid(*, grid: Grid, location: Location) -> bool:
-    row_index, column_index = location
-    if row_index < 0:
-        return False
-    if row_index > len(grid.pipes):
-        return False
-
-    if column_index < 0:
-        return False
-    if column_index > len(grid.pipes[0]):
-        return False
-
-    return True
+    return p1.Loop(cells=cells, directions=directions)
 
 
-def calculate_next_direction(*, pipe: Pipe, previous_direction: Direction) -> Optional[Direction]:
-    direction = invert_direction(direction=previous_direction)
-    try:
-        index = pipe.directions.index(direction)
-    except ValueError:
-        return None
+# the top left cell of the loop has the smallest index and is always a corner pipe, so
+# leaving it to the right means the loop runs clockwise and its inside is on the right
+def find_clockwise_loop(*, sketch: p1.Sketch) -> Tuple[p1.Loop, int]:
+    loop = p1.trace_loop(sketch=sketch)
 
-    return pipe.directions[(index + 1) % 2]
+    top_left_index = loop.cells.index(min(loop.cells))
+    if loop.directions[top_left_index] != p1.RIGHT:
+        loop = reverse_loop(loop=loop)
+        top_left_index = loop.cells.index(min(loop.cells))
 
+    return loop, top_left_index
 
-def calculate_next_step(*, grid: Grid, previous_step: Step) -> Optional[Step]:
-    next_location = calculate_next_location(step=previous_step)
-    if not is_location_in_grid(grid=grid, location=next_location):
-        return None
-
-    if next_location == grid.start:
-        return Step(
-            direction='down',  # doesn't matter because we're back at the start
-            location=next_location,
-        )
-
-    pipe = grid.pipes[next_location[0]][next_location[1]]
-    if pipe is None:
-        return None
 
-    next_direction = calculate_next_direction(pipe=pipe, previous_direction=previous_step.direction)
-    if next_direction is None:
-        return None
-
-    return Step(
-        direction=next_direction,
-        location=next_location,
-    )
-
-
-def calculate_path(*, direction: Direction, grid: Grid) -> Optional[Path]:
-    steps: Sequence[Step] = [Step(direction=direction, location=grid.start)]
-    while True:
-        next_step = calculate_next_step(grid=grid, previous_step=steps[-1])
-        if next_step is None:
-            return None
-        if next_step.location == grid.start:
-            break
-
-        steps.append(next_step)
-
-    return Path(steps=steps)
-
-
-def find_top_left_step(*, path: Path) -> Tuple[int, Step]:
-    result_index = 0
-    result = path.steps[result_index]
-    for index, step in enumerate(path.steps):
-        if step.location[0] > result.location[0]:
-            pass
-        elif step.location[0] < result.location[0]:
-            result_index = index
-            result = step
-        else:  # equal row
-            if step.location[1] < result.location[1]:
-                result_index = index
-                result = step
-
-    return result_index, result
-
-
-def get_right_turn(*, direction: Direction) -> Direction:
-    match direction:
-        case 'up':
-            return 'right'
-        case 'down':
-            return 'left'
-        case 'left':
-            return 'up'
-        case 'right':
-            return 'down'
-        case _:
-            raise Exception(f'unexpected direction {direction}')
-
-
-def find_inner_locations(
+def mark_inner_cells(
     *,
-    direction: Direction,
-    grid: Grid,
-    location: Location,
-    path_locations: Set[Location],
-) -> Set[Location]:
-    inner_locations: Set[Location] = set()
-    next_location = location
+    cell: int,
+    direction: int,
+    inner_cells: bytearray,
+    loop_cells: bytearray,
+    sketch: p1.Sketch,
+) -> None:
+    offset = p1.find_offsets(sketch=sketch)[direction]
     while True:
-        next_location = calculate_next_location(
-            step=Step(
-                direction=direction,
-                location=next_location,
-            )
-        )
-        if not is_location_in_grid(grid=grid, location=next_location):
+        cell += offset
+        if not 0 <= cell < len(loop_cells) or sketch.pipes.cells[cell] == ord('\n'):
             break
-        if next_location in path_locations:
+        if loop_cells[cell]:
             break
 
-        inner_locations.add(next_location)
+        inner_cells[cell] = 1
+
+
+# walks the loop clockwise from its top left cell and looks to the right of every cell,
+# and also straight ahead wherever the loop turns left
+def find_inner_cells(*, loop: p1.Loop, sketch: p1.Sketch, top_left_index: int) -> bytearray:
+    loop_cells = bytearray(len(sketch.connections))
+    for cell in loop.cells:
+        loop_cells[cell] = 1
+
+    inner_cells = bytearray(len(sketch.connections))
+    last_direction = p1.UP
+    for index in range(top_left_index, top_left_index + len(loop.cells)):
+        cell = loop.cells[index % len(loop.cells)]
+        direction = loop.directions[index % len(loop.cells)]
+
+        right_turn = (last_direction + 1) % p1.DIRECTION_COUNT
+        mark_inner_cells(
+            cell=cell,
+            direction=right_turn,
+            inner_cells=inner_cells,
+            loop_cells=loop_cells,
+            sketch=sketch,
+        )
 
-    return inner_locations
+        left_turn = (last_direction - 1) % p1.DIRECTION_COUNT
+        if direction == left_turn:
+            mark_inner_cells(
+                cell=cell,
+                direction=last_direction,
+                inner_cells=inner_cells,
+                loop_cells=loop_cells,
+                sketch=sketch,
+            )
 
+        last_direction = direction
 
-def is_left_turn(*, last_direction: Direction, next_direction: Direction) -> bool:
-    match last_direction:
-        case 'up':
-            return next_direction == 'left'
-        case 'down':
-            return next_direction == 'right'
-        case 'left':
-            return next_direction == 'down'
-        case 'right':
-            return next_direction == 'up'
-        case _:
-            raise Exception(f'unexpected direction {last_direction}')
+    return inner_cells
 
 
-def follow_steps(*, grid: Grid, path: Path, top_left_step_index: int) -> Set[Location]:
-    path_locations = set([
-        step.location
-        for step in path.steps
-    ])
-    indexes = [i for i in range(top_left_step_index, len(path.steps))] + \
-        [i for i in range(top_left_step_index)]
+def count_inner_cells_by_ray_walk(*, sketch: p1.Sketch) -> int:
+    loop, top_left_index = find_clockwise_loop(sketch=sketch)
 
-    inner_locations: Set[Location] = set()
-    last_direction = 'up'
-    for index in indexes:
-        step = path.steps[index]
-        inner_locations.update(
-            find_inner_locations(
-                direction=get_right_turn(direction=last_direction),
-                grid=grid,
-                location=step.location,
-                path_locations=path_locations,
-            )
-        )
-        if is_left_turn(last_direction=last_direction, next_direction=step.direction):
-            # if turning left, then check forward too
-            inner_locations.update(
-                find_inner_locations(
-                    direction=last_direction,
-                    grid=grid,
-                    location=step.location,
-                    path_locations=path_locations,
-                )
-            )
-
-        last_direction = step.direction
-
-    return inner_locations
+    inner_cells = find_inner_cells(loop=loop, sketch=sketch, top_left_index=top_left_index)
+    return inner_cells.count(1)
 
 
-def solution(content: str, /) -> int:
-    grid = parse_grid(content=content)
+# the shoelace formula gives the area enclosed by the centres of the loop cells, and by
+# pick's theorem that area is inner + boundary / 2 - 1, with every loop cell on the boundary
+def count_inner_cells_by_shoelace(*, sketch: p1.Sketch) -> int:
+    loop = p1.trace_loop(sketch=sketch)
 
-    for direction in ('up', 'down', 'left', 'right'):
-        path = calculate_path(
-            direction=direction,
-            grid=grid,
-        )
+    double_area = 0
+    last_row_index, last_column_index = divmod(loop.cells[-1], sketch.pipes.stride)
+    for cell in loop.cells:
+        row_index, column_index = divmod(cell, sketch.pipes.stride)
+        double_area += last_column_index * row_index - column_index * last_row_index
+        last_row_index, last_column_index = row_index, column_index
 
-        if path is None:
-            continue
+    return (abs(double_area) - len(loop.cells)) // 2 + 1
 
-        top_left_step_index, top_left_step = find_top_left_step(path=path)
-        if top_left_step.direction != 'right':
-            continue
 
-        inner_locations = follow_steps(grid=grid, path=path, top_left_step_index=top_left_step_index)
-        return len(inner_locations)
+@registry.register
+def solution(content: str, /) -> int:
+    sketch = p1.parse_sketch(content=content)
+    return count_inner_cells_by_shoelace(sketch=sketch)
 
 
 def main():
@@ -1,18 +1,13 @@
 from dataclasses import dataclass
-import parsy
-from typing import Tuple, Set
+from typing import List, Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid, Location
 
-CELL = parsy.regex(r'[\.#]')
-ROW = CELL.at_least(1)
+GALAXY = ord('#')
 
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
-
-Location = Tuple[int, int]
+# how many lines every empty line turns into
+SPACE = 2
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -21,76 +16,67 @@ class Image:
 
 
 def parse_image(*, content: str) -> Image:
-    rows = CONTENT.parse(content)
-
-    galaxies: Set[Location] = set()
-    for row_index, row in enumerate(rows):
-        for column_index, cell in enumerate(row):
-            match cell:
-                case '.':
-                    continue
-                case '#':
-                    galaxies.add((row_index, column_index))
-                case _:
-                    raise Exception(f'unexpected character: {cell}')
-
-    return Image(galaxies=galaxies)
-
-
-def find_empty_indices(*, image: Image, galaxy_index: int) -> Set[int]:
-    non_empty_indices = set([
-        galaxy[galaxy_index]
-        for galaxy in image.galaxies
-    ])
-    max_index = max(non_empty_indices)
-
-    return set([
-        index
-        for index in range(max_index)
-        if index not in non_empty_indices
-    ])
-
-
-def insert_space_between_galaxies(*, image: Image) -> Image:
-    empty_row_indices = find_empty_indices(image=image, galaxy_index=0)
-    empty_column_indices = find_empty_indices(image=image, galaxy_index=1)
-
-    new_galaxies: Set[Location] = set()
-    for galaxy in image.galaxies:
-        row_index, column_index = galaxy
-
-        row_index_diff = sum(
-            1
-            for index in empty_row_indices
-            if row_index > index
-        )
-        column_index_diff = sum(
-            1
-            for index in empty_column_indices
-            if column_index > index
-        )
+    grid = Grid.from_content(content, alphabet=b'.#')
+
+    return Image(galaxies=set(grid.find_all(GALAXY)))
+
+
+# the summed distance between every pair of galaxies is linear in the space every empty
+# line turns into, so two coefficients answer it for any space
+@dataclass(frozen=True, kw_only=True)
+class Distances:
+    empty_lines_crossed: int
+    raw_distance: int
+
+    def calculate_total_distance(self, *, space: int) -> int:
+        return self.raw_distance + (space - 1) * self.empty_lines_crossed
+
 
-        new_galaxies.add((
-            row_index + row_index_diff,
-            column_index + column_index_diff,
-        ))
+# how many empty lines lie before each coordinate, counting the gaps between consecutive
+# occupied lines; lines before the first galaxy move every galaxy alike, so they are skipped
+def count_empty_lines_before(*, sorted_coordinates: Sequence[int]) -> List[int]:
+    empty_line_counts: List[int] = []
+    empty_line_count = 0
+    for index, coordinate in enumerate(sorted_coordinates):
+        if index > 0 and coordinate > sorted_coordinates[index - 1]:
+            empty_line_count += coordinate - sorted_coordinates[index - 1] - 1
 
-    return Image(galaxies=new_galaxies)
+        empty_line_counts.append(empty_line_count)
 
+    return empty_line_counts
 
-def calculate_distance_between_galaxies(*, image: Image) -> int:
-    return sum(
-        abs(galaxy_a[0] - galaxy_b[0]) + abs(galaxy_a[1] - galaxy_b[1])
-        for galaxy_a in image.galaxies
-        for galaxy_b in image.galaxies
-    ) // 2
 
+# every value is at least the ones before it, so it lies index * value minus the sum of
+# those values away from them
+def sum_pairwise_distances(*, sorted_values: Sequence[int]) -> int:
+    total_distance = 0
+    prefix_sum = 0
+    for index, value in enumerate(sorted_values):
+        total_distance += index * value - prefix_sum
+        prefix_sum += value
 
+    return total_distance
+
+
+# manhattan distances split into a row part and a column part, which are summed separately
+def measure_distances(*, image: Image) -> Distances:
+    empty_lines_crossed = 0
+    raw_distance = 0
+    for axis in (0, 1):
+        sorted_coordinates = sorted(galaxy[axis] for galaxy in image.galaxies)
+
+        empty_lines_crossed += sum_pairwise_distances(
+            sorted_values=count_empty_lines_before(sorted_coordinates=sorted_coordinates),
+        )
+        raw_distance += sum_pairwise_distances(sorted_values=sorted_coordinates)
+
+    return Distances(empty_lines_crossed=empty_lines_crossed, raw_distance=raw_distance)
+
+
+@registry.register
 def solution(content: str, /) -> int:
     image = parse_image(content=content)
-    spaced_image = insert_space_between_galaxies(image=image)
-
-    return calculate_distance_between_galaxies(image=spaced_image)
+    return measure_distances(image=image).calculate_total_distance(space=SPACE)
 
 
 def main():
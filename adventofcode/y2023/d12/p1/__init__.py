@@ -1,8 +1,10 @@
+from array import array
+import bisect
 from dataclasses import dataclass
 import parsy
-from typing import Sequence, Optional
+from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 SPRING = parsy.regex(r'[\?\.#]')
 ROW = parsy.seq(
@@ -24,7 +26,7 @@ class SpringRow:
 
 
 def parse_spring_rows(*, content: str) -> Sequence[SpringRow]:
-    rows = CONTENT.parse(content)
+    rows = parsers.parse(CONTENT, content)
 
     return [
         SpringRow(damaged_groups=damaged_groups, springs=springs)
@@ -32,91 +34,65 @@ def parse_spring_rows(*, content: str) -> Sequence[SpringRow]:
     ]
 
 
-def calculate_arrangements(
-        *,
-        springs: str,
-        damaged_groups: Sequence[int],
-        damage_count: Optional[int] = 0,
-) -> int:
-    for index, spring in enumerate(springs):
-        match spring:
-            case '#':
-                damage_count += 1
-
-                if len(damaged_groups) == 0:
-                    # invalid configuration
-                    return 0
-
-                if damage_count > damaged_groups[0]:
-                    # invalid configuration
-                    return 0
-            case '.':
-                if damage_count == 0:
-                    continue
-
-                if len(damaged_groups) == 0:
-                    continue
-
-                if damage_count != damaged_groups[0]:
-                    # invalid configuration
-                    return 0
-
-                # good, recurse down
-                return calculate_arrangements(
-                    damaged_groups=damaged_groups[1:],
-                    springs=springs[index + 1:],
-                )
-            case '?':
-                if len(damaged_groups) == 0:
-                    return calculate_arrangements(
-                        damage_count=damage_count,
-                        damaged_groups=damaged_groups,
-                        springs=f'.{springs[index + 1:]}',
-                    )
-
-                if damage_count == damaged_groups[0]:
-                    return calculate_arrangements(
-                        damage_count=0,
-                        damaged_groups=damaged_groups[1:],
-                        springs=f'.{springs[index + 1:]}',
-                    )
-
-                value_if_damaged = calculate_arrangements(
-                    damage_count=damage_count,
-                    damaged_groups=damaged_groups,
-                    springs=f'#{springs[index + 1:]}',
-                )
-                value_if_not_damaged = calculate_arrangements(
-                    damage_count=damage_count,
-                    damaged_groups=damaged_groups,
-                    springs=f'.{springs[index + 1:]}',
-                )
-
-                return value_if_damaged + value_if_not_damaged
-            case _:
-                raise Exception(f'unexpected spring: {spring}')
-
-    if len(damaged_groups) == 0:
-        return 1
-
-    if len(damaged_groups) > 1:
-        # invalid
-        return 0
-
-    if damage_count != damaged_groups[0]:
-        # invalid
-        return 0
-
-    return 1
+# Counts arrangements bottom-up over (position, group index): the number of ways to fill
+# springs[position:] with damaged_groups[group_index:] is the count one position on (when
+# the spring can be operational) plus the count just past the separator after the group
+# (when the whole group can start here). A run of damaged springs is always placed as a
+# whole group, so the run length never needs to be part of the state.
+def count_arrangements(*, damaged_groups: Sequence[int], springs: str) -> int:
+    spring_count = len(springs)
+    group_count = len(damaged_groups)
+    width = group_count + 1
 
+    # how many springs, starting at each position, could all be damaged
+    damageable_lengths = array('i', [0]) * (spring_count + 1)
+    for position in range(spring_count - 1, -1, -1):
+        if springs[position] != '.':
+            damageable_lengths[position] = damageable_lengths[position + 1] + 1
 
+    # the fewest springs that damaged_groups[:group_index] fit into, each followed by a separator
+    prefix_lengths = array('i', [0]) * (group_count + 1)
+    for group_index in range(group_count):
+        prefix_lengths[group_index + 1] = prefix_lengths[group_index] + damaged_groups[group_index] + 1
+
+    # arrangements[position * width + group_index], as a flat table of Python ints since the
+    # counts outgrow 64 bits for large unfold factors; the extra last row stands for the
+    # position after a group that ends exactly at the end of the row
+    arrangements = [0] * ((spring_count + 2) * width)
+    arrangements[spring_count * width + group_count] = 1
+    arrangements[(spring_count + 1) * width + group_count] = 1
+
+    for position in range(spring_count - 1, -1, -1):
+        spring = springs[position]
+        row = position * width
+
+        # only the groups that fit before this position, and leave the rest enough room after it
+        first_group_index = bisect.bisect_left(prefix_lengths, prefix_lengths[-1] - (spring_count - position + 1))
+        last_group_index = bisect.bisect_right(prefix_lengths, position) - 1
+
+        for group_index in range(first_group_index, last_group_index + 1):
+            count = 0
+            if spring != '#':
+                count = arrangements[row + width + group_index]
+
+            if spring != '.' and group_index < group_count:
+                end = position + damaged_groups[group_index]
+                if damageable_lengths[position] >= damaged_groups[group_index] and (end == spring_count or springs[end] != '#'):
+                    count += arrangements[(end + 1) * width + group_index + 1]
+
+            arrangements[row + group_index] = count
+
+    return arrangements[0]
+
+
+@registry.register
 def solution(content: str, /) -> int:
     spring_rows = parse_spring_rows(content=content)
 
     return sum(
-        calculate_arrangements(
-            springs=spring_row.springs,
+        count_arrangements(
             damaged_groups=spring_row.damaged_groups,
+            springs=spring_row.springs,
         )
         for spring_row in spring_rows
     )
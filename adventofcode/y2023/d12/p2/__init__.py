@@ -1,149 +1,33 @@
-from dataclasses import dataclass
-import parsy
-from typing import Sequence, Optional
+from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, registry
+from adventofcode.y2023.d12 import p1
 
-SPRING = parsy.regex(r'[\?\.#]')
-ROW = parsy.seq(
-    SPRING.at_least(1).concat()
-    .skip(parsers.SPACE),
-    parsers.NUMBER.sep_by(parsy.string(','))
-)
+UNFOLD_FACTOR = 5
 
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
-
-
-@dataclass(frozen=True, kw_only=True)
-class SpringRow:
-    damaged_groups: Sequence[int]
-    springs: str
 
+def unfold_spring_row(*, factor: int, spring_row: p1.SpringRow) -> p1.SpringRow:
+    return p1.SpringRow(
+        damaged_groups=tuple(spring_row.damaged_groups) * factor,
+        springs='?'.join([spring_row.springs] * factor),
+    )
 
-def parse_spring_rows(*, content: str) -> Sequence[SpringRow]:
-    rows = CONTENT.parse(content)
 
+def parse_spring_rows(*, content: str) -> Sequence[p1.SpringRow]:
     return [
-        SpringRow(
-            damaged_groups=tuple(damaged_groups * 5),
-            springs='?'.join([springs] * 5),
-        )
-        for springs, damaged_groups in rows
+        unfold_spring_row(factor=UNFOLD_FACTOR, spring_row=spring_row)
+        for spring_row in p1.parse_spring_rows(content=content)
     ]
 
 
-class Memoize:
-    def __init__(self, fn):
-        self.fn = fn
-        self.memo = {}
-
-    def __call__(
-            self,
-            *,
-            springs: str,
-            damaged_groups: Sequence[int],
-            damage_count: Optional[int] = 0,
-    ) -> int:
-        key = (springs, damaged_groups, damage_count)
-        if key not in self.memo:
-            self.memo[key] = self.fn(
-                springs=springs,
-                damaged_groups=damaged_groups,
-                damage_count=damage_count,
-            )
-
-        return self.memo[key]
-
-
-@Memoize
-def calculate_arrangements(
-        *,
-        springs: str,
-        damaged_groups: Sequence[int],
-        damage_count: Optional[int] = 0,
-) -> int:
-    for index, spring in enumerate(springs):
-        match spring:
-            case '#':
-                damage_count += 1
-
-                if len(damaged_groups) == 0:
-                    # invalid configuration
-                    return 0
-
-                if damage_count > damaged_groups[0]:
-                    # invalid configuration
-                    return 0
-            case '.':
-                if damage_count == 0:
-                    continue
-
-                if len(damaged_groups) == 0:
-                    continue
-
-                if damage_count != damaged_groups[0]:
-                    # invalid configuration
-                    return 0
-
-                # good, recurse down
-                return calculate_arrangements(
-                    damaged_groups=damaged_groups[1:],
-                    springs=springs[index + 1:],
-                )
-            case '?':
-                if len(damaged_groups) == 0:
-                    return calculate_arrangements(
-                        damage_count=damage_count,
-                        damaged_groups=damaged_groups,
-                        springs=f'.{springs[index + 1:]}',
-                    )
-
-                if damage_count == damaged_groups[0]:
-                    return calculate_arrangements(
-                        damage_count=0,
-                        damaged_groups=damaged_groups[1:],
-                        springs=f'.{springs[index + 1:]}',
-                    )
-
-                value_if_damaged = calculate_arrangements(
-                    damage_count=damage_count,
-                    damaged_groups=damaged_groups,
-                    springs=f'#{springs[index + 1:]}',
-                )
-                value_if_not_damaged = calculate_arrangements(
-                    damage_count=damage_count,
-                    damaged_groups=damaged_groups,
-                    springs=f'.{springs[index + 1:]}',
-                )
-
-                return value_if_damaged + value_if_not_damaged
-            case _:
-                raise Exception(f'unexpected spring: {spring}')
-
-    if len(damaged_groups) == 0:
-        return 1
-
-    if len(damaged_groups) > 1:
-        # invalid
-        return 0
-
-    if damage_count != damaged_groups[0]:
-        # invalid
-        return 0
-
-    return 1
-
-
+@registry.register
 def solution(content: str, /) -> int:
     spring_rows = parse_spring_rows(content=content)
 
     return sum(
-        calculate_arrangements(
-            springs=spring_row.springs,
+        p1.count_arrangements(
             damaged_groups=spring_row.damaged_groups,
+            springs=spring_row.springs,
         )
         for spring_row in spring_rows
     )
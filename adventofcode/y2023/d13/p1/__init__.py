@@ -1,83 +1,120 @@
+from array import array
 from dataclasses import dataclass
-import parsy
-from typing import Sequence 
+from typing import Dict, Iterable, List, Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid
 
-ASH_OR_ROCK = parsy.regex(r'[\.#]')
-ROW = ASH_OR_ROCK.at_least(1).concat()
-FIELD = ROW.sep_by(parsers.NEWLINE)
 
-CONTENT = (
-    FIELD.sep_by(parsers.NEWLINE.times(2))
-    .skip(parsers.NEWLINE.many())
-)
+# rocks are 1 bits, so a pair of lines differs in popcount(a ^ b) cells
+ROCK_BITS = bytes.maketrans(b'.#', b'01')
+
+SMUDGE_COUNT = 0
 
 
 @dataclass(frozen=True, kw_only=True)
 class Field:
-    rows: Sequence[str]
-
+    columns: Sequence[int]
+    rows: Sequence[int]
 
-def parse_fields(*, content: str) -> Sequence[Field]:
-    fields = CONTENT.parse(content)
 
+def encode_lines(*, lines: Iterable[memoryview]) -> List[int]:
     return [
-        Field(rows=field)
-        for field in fields
+        int(bytes(line).translate(ROCK_BITS), 2)
+        for line in lines
     ]
 
 
-def find_reflection_row(*, field: Field) -> int:
-    for index in range(len(field.rows) - 1):
-        top_index = index
-        bottom_index = index + 1
+def parse_fields(*, content: str) -> Sequence[Field]:
+    fields = []
+    # fields are separated by a blank line
+    for block in content.rstrip('\n').split('\n\n'):
+        grid = Grid.from_content(block, alphabet=b'.#')
+        fields.append(Field(columns=encode_lines(lines=grid.columns()), rows=encode_lines(lines=grid.rows())))
 
-        while field.rows[top_index] == field.rows[bottom_index]:
-            top_index -= 1
-            bottom_index += 1
+    return fields
 
-            if top_index < 0:
-                return index + 1
 
-            if bottom_index >= len(field.rows):
-                return index + 1
+# numbers the distinct lines, so comparing two lines no longer depends on the width
+def assign_ids(*, lines: Sequence[int]) -> array:
+    ids_by_line: Dict[int, int] = {}
 
-    return 0
+    return array('i', (
+        ids_by_line.setdefault(line, len(ids_by_line))
+        for line in lines
+    ))
 
 
-def get_column(*, field: Field, index: int) -> str:
-    return ''.join([
-        row[index]
-        for row in field.rows
-    ])
+# manacher's algorithm restricted to even palindromes: radii[index] is how many lines
+# mirror each other around the gap before lines[index]. A gap inside the rightmost
+# palindrome found so far starts from the radius of its mirror image, so every line is
+# compared O(1) times overall
+def find_palindrome_radii(*, ids: Sequence[int]) -> array:
+    radii = array('i', [0]) * (len(ids) + 1)
 
+    left, right = 0, 0
+    for index in range(1, len(ids)):
+        radius = 0
+        if index < right:
+            radius = min(radii[left + right - index], right - index)
 
-def find_reflection_column(*, field: Field) -> int:
-    for index in range(len(field.rows[0]) - 1):
-        left_index = index
-        right_index = index + 1
+        while index - radius > 0 and index + radius < len(ids) and ids[index - radius - 1] == ids[index + radius]:
+            radius += 1
 
-        while get_column(field=field, index=left_index) == get_column(field=field, index=right_index):
-            left_index -= 1
-            right_index += 1
+        radii[index] = radius
+        if index + radius > right:
+            left, right = index - radius, index + radius
 
-            if left_index < 0:
-                return index + 1
+    return radii
 
-            if right_index >= len(field.rows[0]):
-                return index + 1
+
+# every line of reflection, as the number of lines before it, in O(n)
+def find_reflections(*, lines: Sequence[int]) -> List[int]:
+    radii = find_palindrome_radii(ids=assign_ids(lines=lines))
+
+    return [
+        index
+        for index in range(1, len(lines))
+        if radii[index] == min(index, len(lines) - index)
+    ]
+
+
+# the number of lines before the first line of reflection across which exactly
+# smudge_count cells differ, or 0 if there is none
+def find_reflection(*, lines: Sequence[int], smudge_count: int) -> int:
+    if smudge_count == 0:
+        reflections = find_reflections(lines=lines)
+        return reflections[0] if len(reflections) > 0 else 0
+
+    for index in range(1, len(lines)):
+        difference_count = 0
+        for distance in range(min(index, len(lines) - index)):
+            difference_count += (lines[index - 1 - distance] ^ lines[index + distance]).bit_count()
+            if difference_count > smudge_count:
+                break
+
+        if difference_count == smudge_count:
+            return index
 
     return 0
 
 
+def find_reflection_row(*, field: Field, smudge_count: int) -> int:
+    return find_reflection(lines=field.rows, smudge_count=smudge_count)
+
+
+def find_reflection_column(*, field: Field, smudge_count: int) -> int:
+    return find_reflection(lines=field.columns, smudge_count=smudge_count)
+
+
+@registry.register
 def solution(content: str, /) -> int:
     fields = parse_fields(content=content)
 
     total = 0
     for field in fields:
-        reflection_row = find_reflection_row(field=field)
-        reflection_column = find_reflection_column(field=field)
+        reflection_row = find_reflection_row(field=field, smudge_count=SMUDGE_COUNT)
+        reflection_column = find_reflection_column(field=field, smudge_count=SMUDGE_COUNT)
 
         total += 100 * reflection_row + reflection_column
 
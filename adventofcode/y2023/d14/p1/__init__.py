@@ -1,72 +1,44 @@
-import copy
-import parsy
-from typing import Sequence, Tuple
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid
 
-from adventofcode.helpers import executor, parsers
+EMPTY = ord('.')
+ROUND_ROCK = ord('O')
+CUBE_ROCK = ord('#')
 
-ROCK = parsy.regex(r'[\.#O]')
-ROW = ROCK.at_least(1)
 
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
+# rolls every round rock in a row or column view towards its start (or end) until it
+# hits a cube rock, by rewriting each stretch between cube rocks in one go
+def roll_line(line: memoryview, /, *, towards_start: bool) -> None:
+    segments = bytes(line).split(bytes((CUBE_ROCK,)))
 
-Location = Tuple[int, int]
+    rolled_segments = []
+    for segment in segments:
+        rocks = bytes((ROUND_ROCK,)) * segment.count(ROUND_ROCK)
+        spaces = bytes((EMPTY,)) * (len(segment) - len(rocks))
 
+        rolled_segments.append(rocks + spaces if towards_start else spaces + rocks)
 
-def print_rows(rows: Sequence[Sequence[str]], /) -> None:
-    for row in rows:
-        print(''.join(row))
-    print()
+    line[:] = bytes((CUBE_ROCK,)).join(rolled_segments)
 
 
-def roll_rock_north(*, rows: Sequence[Sequence[str]], rock_location: Location) -> Sequence[Sequence[str]]:
-    north_rock_row_location = (rock_location[0] - 1, rock_location[1])
-    if north_rock_row_location[0] < 0:
-        return rows
+def roll_rocks_north(*, grid: Grid) -> None:
+    for column in grid.columns():
+        roll_line(column, towards_start=True)
 
-    north_rock = rows[north_rock_row_location[0]][north_rock_row_location[1]]
-    match north_rock:
-        case '.':
-            new_rows = copy.deepcopy(rows)
-            new_rows[rock_location[0]][rock_location[1]] = '.'
-            new_rows[north_rock_row_location[0]][north_rock_row_location[1]] = 'O'
 
-            return roll_rock_north(rows=new_rows, rock_location=north_rock_row_location)
-        case '#' | 'O':
-            return rows
-        case _:
-            raise Exception('unexpected rock')
-
-
-def roll_rocks_north(*, rows: Sequence[Sequence[str]]) -> Sequence[Sequence[str]]:
-    new_rows = rows
-    for row_index, row in enumerate(rows):
-        for column_index, cell in enumerate(row):
-            match cell:
-                case '.' | '#':
-                    pass
-                case 'O':
-                    new_rows = roll_rock_north(rows=new_rows, rock_location=(row_index, column_index))
-                case _:
-                    raise Exception('unexpected cell')
-
-    return new_rows
-
-
-def count_rocks(*, rows: Sequence[Sequence[str]]) -> int:
+def count_rocks(*, grid: Grid) -> int:
     return sum(
-        row.count('O') * (len(rows) - index)
-        for index, row in enumerate(rows)
+        bytes(row).count(ROUND_ROCK) * (grid.height - index)
+        for index, row in enumerate(grid.rows())
     )
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    rows = CONTENT.parse(content)
-    new_rows = roll_rocks_north(rows=rows)
+    grid = Grid.from_content(content, alphabet=b'.#O')
+    roll_rocks_north(grid=grid)
 
-    return count_rocks(rows=new_rows)
+    return count_rocks(grid=grid)
 
 
 def main():
@@ -1,172 +1,93 @@
-import parsy
-from typing import Sequence
+from dataclasses import dataclass
+from typing import Tuple
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import cycles, executor, registry
+from adventofcode.helpers.grid import Grid
 
-ROCK = parsy.regex(r'[\.#O]')
-ROW = ROCK.at_least(1)
+CYCLE_COUNT = 1_000_000_000
 
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
+# translation tables that turn a row of cells into a string of bits
+CELL_BITS = bytes.maketrans(b'.#O', b'111')
+CUBE_ROCK_BITS = bytes.maketrans(b'.#O', b'010')
+ROUND_ROCK_BITS = bytes.maketrans(b'.#O', b'001')
 
-Grid = Sequence[Sequence[str]]
 
+# The board is packed into integers with one bit per cell, row after row, with one
+# unused bit at the end of every row so that rocks cannot roll from one row into the
+# next. A tilt shifts the whole board at once: every round rock with an empty cell in
+# front of it moves one step, and that repeats until nothing moves.
+@dataclass(frozen=True, kw_only=True)
+class Platform:
+    empty_cells: int  # every cell that is not a cube rock
+    height: int
+    row_mask: int
+    stride: int
 
-def find_left(values: Sequence[str], /, *, char: str, start: int, stop: int) -> int:
-    try:
-        return values.index(char, start, stop)
-    except ValueError:
-        return -1
 
+def to_bits(grid: Grid, /, *, table: bytes) -> int:
+    bits = b''.join(
+        bytes(row).translate(table) + b'0'
+        for row in grid.rows()
+    )
 
-def find_right(values: Sequence[str], /, *, char: str, start: int, stop: int) -> int:
-    for index in range(stop - 1, start - 1, -1):
-        if values[index] == char:
-            return index
-
-    return -1
-
-
-def roll_rocks_west(*, grid: Grid) -> None:
-    for row in grid:
-        solid_rocks = [index for index, char in enumerate(row) if char == '#'] + [len(row)]
-
-        for index, solid_rock in enumerate(solid_rocks):
-            start_index = 0 if index == 0 else solid_rocks[index - 1]
-            stop_index = solid_rock
-
-            while True:
-                leftmost_empty = find_left(row, char='.', start=start_index, stop=stop_index)
-                rightmost_rock = find_right(row, char='O', start=start_index, stop=stop_index)
-
-                if leftmost_empty == -1 or rightmost_rock == -1:
-                    break
-
-                if leftmost_empty > rightmost_rock:
-                    break
-
-                row[leftmost_empty], row[rightmost_rock] = row[rightmost_rock], row[leftmost_empty]
-
-
-def roll_rocks_east(*, grid: Grid) -> None:
-    for row in grid:
-        solid_rocks = [index for index, char in enumerate(row) if char == '#'] + [len(row)]
-
-        for index, solid_rock in enumerate(solid_rocks):
-            start_index = 0 if index == 0 else solid_rocks[index - 1]
-            stop_index = solid_rock
-
-            while True:
-                rightmost_empty = find_right(row, char='.', start=start_index, stop=stop_index)
-                leftmost_rock = find_left(row, char='O', start=start_index, stop=stop_index)
-
-                if rightmost_empty == -1 or leftmost_rock == -1:
-                    break
-
-                if rightmost_empty < leftmost_rock:
-                    break
-
-                row[rightmost_empty], row[leftmost_rock] = row[leftmost_rock], row[rightmost_empty]
-
-
-def roll_rocks_north(*, grid: Grid) -> None:
-    for column_index in range(len(grid[0])):
-        column = [grid[i][column_index] for i in range(len(grid))]
-        solid_rocks = [index for index, char in enumerate(column) if char == '#'] + [len(column)]
-
-        for solid_rock_index, solid_rock in enumerate(solid_rocks):
-            start_index = 0 if solid_rock_index == 0 else solid_rocks[solid_rock_index - 1]
-            stop_index = solid_rock
-
-            while True:
-                topmost_empty = find_left(column, char='.', start=start_index, stop=stop_index)
-                bottommost_rock = find_right(column, char='O', start=start_index, stop=stop_index)
-
-                if topmost_empty == -1 or bottommost_rock == -1:
-                    break
-
-                if topmost_empty > bottommost_rock:
-                    break
-
-                column[topmost_empty], column[bottommost_rock] = column[bottommost_rock], column[topmost_empty]
-
-        for i, cell in enumerate(column):
-            grid[i][column_index] = cell
+    return int(bits[::-1], 2)
 
 
-def roll_rocks_south(*, grid: Grid) -> None:
-    for column_index in range(len(grid[0])):
-        column = [grid[i][column_index] for i in range(len(grid))]
-        solid_rocks = [index for index, char in enumerate(column) if char == '#'] + [len(column)]
+def parse_platform(*, content: str) -> Tuple[Platform, int]:
+    grid = Grid.from_content(content, alphabet=b'.#O')
 
-        for solid_rock_index, solid_rock in enumerate(solid_rocks):
-            start_index = 0 if solid_rock_index == 0 else solid_rocks[solid_rock_index - 1]
-            stop_index = solid_rock
+    platform = Platform(
+        empty_cells=to_bits(grid, table=CELL_BITS) ^ to_bits(grid, table=CUBE_ROCK_BITS),
+        height=grid.height,
+        row_mask=(1 << grid.width) - 1,
+        stride=grid.width + 1,
+    )
 
-            while True:
-                bottommost_empty = find_right(column, char='.', start=start_index, stop=stop_index)
-                topmost_rock = find_left(column, char='O', start=start_index, stop=stop_index)
+    return platform, to_bits(grid, table=ROUND_ROCK_BITS)
 
-                if bottommost_empty == -1 or topmost_rock == -1:
-                    break
 
-                if bottommost_empty < topmost_rock:
-                    break
+# offset is the distance in bits from a cell to the one a rock rolls into;
+# negative offsets roll towards the first row or column
+def roll_rocks(*, offset: int, platform: Platform, rocks: int) -> int:
+    while True:
+        free = platform.empty_cells ^ rocks
 
-                column[bottommost_empty], column[topmost_rock] = column[topmost_rock], column[bottommost_empty]
+        if offset < 0:
+            moving = rocks & (free << -offset)
+            rocks = (rocks ^ moving) | (moving >> -offset)
+        else:
+            moving = rocks & (free >> offset)
+            rocks = (rocks ^ moving) | (moving << offset)
 
-        for i, cell in enumerate(column):
-            grid[i][column_index] = cell
+        if moving == 0:
+            return rocks
 
 
-def cycle_rocks(*, grid: Grid) -> None:
-    roll_rocks_north(grid=grid)
-    roll_rocks_west(grid=grid)
-    roll_rocks_south(grid=grid)
-    roll_rocks_east(grid=grid)
+def cycle_rocks(*, platform: Platform, rocks: int) -> int:
+    rocks = roll_rocks(offset=-platform.stride, platform=platform, rocks=rocks)  # north
+    rocks = roll_rocks(offset=-1, platform=platform, rocks=rocks)  # west
+    rocks = roll_rocks(offset=platform.stride, platform=platform, rocks=rocks)  # south
+    return roll_rocks(offset=1, platform=platform, rocks=rocks)  # east
 
 
-def count_rocks(*, grid: Grid) -> int:
+def count_rocks(*, platform: Platform, rocks: int) -> int:
     return sum(
-        row.count('O') * (len(grid) - index)
-        for index, row in enumerate(grid)
+        ((rocks >> (row_index * platform.stride)) & platform.row_mask).bit_count() * (platform.height - row_index)
+        for row_index in range(platform.height)
     )
 
 
-def print_grid(grid: Grid, /) -> None:
-    for row in grid:
-        print(''.join(row))
-    print()
-
-
-def determine_pattern_length(*, values: Sequence[int]) -> int:
-    for pattern_length in range(1, 1_000):
-        for i in range(pattern_length, len(values), pattern_length):
-            if values[i] != values[i - pattern_length]:
-                break
-        else:
-            return pattern_length
-
-    raise Exception('failed to find pattern length')
-
-
+@registry.register
 def solution(content: str, /) -> int:
-    grid = CONTENT.parse(content)
-
-    for _ in range(1_000):
-        cycle_rocks(grid=grid)
+    platform, rocks = parse_platform(content=content)
 
-    weights = []
-    for _ in range(1_000):
-        cycle_rocks(grid=grid)
-        weights.append(count_rocks(grid=grid))
-
-    pattern_length = determine_pattern_length(values=weights)
-    weight_index = (1_000_000_000 - 1_000 - 1) % pattern_length
+    rocks = cycles.find_state(
+        rocks,
+        CYCLE_COUNT,
+        transition=lambda x: cycle_rocks(platform=platform, rocks=x),
+    )
 
-    return weights[weight_index]
+    return count_rocks(platform=platform, rocks=rocks)
 
 
 def main():
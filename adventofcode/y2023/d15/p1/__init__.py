@@ -1,6 +1,6 @@
 import parsy
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 CHAR = parsy.regex(r'[a-z0-9\=\-]')
 STEP = CHAR.at_least(1).concat()
@@ -21,8 +21,9 @@ def calculate_hash(string: str, /) -> int:
     return value
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    sequence = CONTENT.parse(content)
+    sequence = parsers.parse(CONTENT, content)
 
     return sum(
         calculate_hash(step)
@@ -1,6 +1,6 @@
 import parsy
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 from typing import Sequence, Union, Tuple
 
 LABEL = parsy.letter.at_least(1).concat()
@@ -71,8 +71,9 @@ def calculate_hashmap_value(*, hashmap: Sequence[Sequence[Tuple[str, int]]]) ->
     return total
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    sequence = CONTENT.parse(content)
+    sequence = parsers.parse(CONTENT, content)
     hashmap = calculate_hashmap(sequence=sequence)
 
     return calculate_hashmap_value(hashmap=hashmap)
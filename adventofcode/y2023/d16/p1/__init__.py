@@ -1,127 +1,74 @@
-import parsy
-from typing import Sequence, Literal, Union, Tuple, Set
-
-from adventofcode.helpers import executor, parsers
-import sys
-sys.setrecursionlimit(8_000)
-
-CELL = parsy.regex(r'[\.\|\-\\\/]')
-ROW = CELL.at_least(1).concat()
-
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
-
-Location = Tuple[int, int]
-Direction = Union[
-    Literal['up'],
-    Literal['down'],
-    Literal['left'],
-    Literal['right'],
-]
-Step = Tuple[Location, Direction]
-Grid = Sequence[str]
-
-
-def walk_path(*, grid: Grid, step: Step, visited_steps: Set[Step]) -> None:
-    if step in visited_steps:
-        return
-
-    visited_steps.add(step)
-    location, direction = step
-    cell = grid[location[0]][location[1]]
-
-    next_directions: Sequence[Direction]
-    match cell:
-        case '.':
-            next_directions = [direction]
-        case '|':
-            match direction:
-                case 'up' | 'down':
-                    next_directions = [direction]
-                case 'left' | 'right':
-                    next_directions = ['up', 'down']
-                case _:
-                    raise Exception('unexpected direction')
-        case '-':
-            match direction:
-                case 'up' | 'down':
-                    next_directions = ['left', 'right']
-                case 'left' | 'right':
-                    next_directions = [direction]
-                case _:
-                    raise Exception('unexpected direction')
-        case '/':
-            match direction:
-                case 'up':
-                    next_directions = ['right']
-                case 'down':
-                    next_directions = ['left']
-                case 'left':
-                    next_directions = ['down']
-                case 'right':
-                    next_directions = ['up']
-                case _:
-                    raise Exception('unexpected direction')
-        case '\\':
-            match direction:
-                case 'up':
-                    next_directions = ['left']
-                case 'down':
-                    next_directions = ['right']
-                case 'left':
-                    next_directions = ['up']
-                case 'right':
-                    next_directions = ['down']
-                case _:
-                    raise Exception('unexpected direction')
-        case _:
-            raise Exception('unexpected cell')
-
-    for next_direction in next_directions:
-        next_location: Location
-        match next_direction:
-            case 'up':
-                next_location = (location[0] - 1, location[1])
-            case 'down':
-                next_location = (location[0] + 1, location[1])
-            case 'left':
-                next_location = (location[0], location[1] - 1)
-            case 'right':
-                next_location = (location[0], location[1] + 1)
-            case _:
-                raise Exception('unexpected direction')
-
-        if next_location[0] < 0 or next_location[0] >= len(grid):
-            continue
-        if next_location[1] < 0 or next_location[1] >= len(grid[0]):
-            continue
-
-        walk_path(
-            grid=grid,
-            step=(next_location, next_direction),
-            visited_steps=visited_steps,
-        )
+from typing import Dict, List, Tuple
 
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid, Location
 
+CELLS = b'.|-\\/'
+
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTION_COUNT = 4
+
+ROW_OFFSETS = (-1, 0, 1, 0)
+COLUMN_OFFSETS = (0, 1, 0, -1)
+
+# the directions a beam leaves a cell in, by the kind of cell and the direction it entered in
+NEXT_DIRECTIONS_BY_CELL: Dict[int, Tuple[Tuple[int, ...], ...]] = {
+    ord('.'): ((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+    ord('|'): ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+    ord('-'): ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)),
+    ord('/'): ((RIGHT,), (UP,), (LEFT,), (DOWN,)),
+    ord('\\'): ((LEFT,), (DOWN,), (RIGHT,), (UP,)),
+}
+
+# a beam state is cell_index * DIRECTION_COUNT + direction, where cell_index counts
+# cells row after row and direction is the one the beam entered the cell in
+State = int
+
+
+def to_state(*, direction: int, grid: Grid, location: Location) -> State:
+    return grid.index(location) * DIRECTION_COUNT + direction
+
+
+def find_next_states(*, grid: Grid, state: State) -> List[State]:
+    cell_index, direction = divmod(state, DIRECTION_COUNT)
+    row_index, column_index = grid.location(cell_index)
+
+    next_states = []
+    for next_direction in NEXT_DIRECTIONS_BY_CELL[grid.cells[cell_index]][direction]:
+        next_location = (row_index + ROW_OFFSETS[next_direction], column_index + COLUMN_OFFSETS[next_direction])
+        if grid.contains(next_location):
+            next_states.append(to_state(direction=next_direction, grid=grid, location=next_location))
+
+    return next_states
+
+
+def count_energized_tiles(*, grid: Grid, initial_state: State) -> int:
+    visited_states = bytearray(len(grid.cells) * DIRECTION_COUNT)
+    energized_cells = bytearray(len(grid.cells))
+
+    stack = [initial_state]
+    visited_states[initial_state] = 1
+    while len(stack) > 0:
+        state = stack.pop()
+        energized_cells[state // DIRECTION_COUNT] = 1
+
+        for next_state in find_next_states(grid=grid, state=state):
+            if not visited_states[next_state]:
+                visited_states[next_state] = 1
+                stack.append(next_state)
+
+    return len(energized_cells) - energized_cells.count(0)
+
+
+@registry.register
 def solution(content: str, /) -> int:
-    grid = CONTENT.parse(content)
+    grid = Grid.from_content(content, alphabet=CELLS)
 
-    visited_steps: Set[Step] = set()
-    walk_path(
+    return count_energized_tiles(
         grid=grid,
-        step=((0, 0), 'right'),
-        visited_steps=visited_steps,
+        initial_state=to_state(direction=RIGHT, grid=grid, location=(0, 0)),
     )
 
-    visited_locations = set(
-        step[0]
-        for step in visited_steps
-    )
-
-    return len(visited_locations)
-
 
 def main():
     executor.execute_example(solution)
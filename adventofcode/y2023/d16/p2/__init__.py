@@ -1,153 +1,213 @@
-import parsy
-from typing import Sequence, Literal, Union, Tuple, Set
-
-from adventofcode.helpers import executor, parsers
-import sys
-sys.setrecursionlimit(8_000)
-
-CELL = parsy.regex(r'[\.\|\-\\\/]')
-ROW = CELL.at_least(1).concat()
-
-CONTENT = (
-    ROW.sep_by(parsers.NEWLINE)
-    .skip(parsers.NEWLINE.many())
-)
-
-Location = Tuple[int, int]
-Direction = Union[
-    Literal['up'],
-    Literal['down'],
-    Literal['left'],
-    Literal['right'],
-]
-Step = Tuple[Location, Direction]
-Grid = Sequence[str]
-
-
-def walk_path(*, grid: Grid, step: Step, visited_steps: Set[Step]) -> None:
-    if step in visited_steps:
-        return
-
-    visited_steps.add(step)
-    location, direction = step
-    cell = grid[location[0]][location[1]]
-
-    next_directions: Sequence[Direction]
-    match cell:
-        case '.':
-            next_directions = [direction]
-        case '|':
-            match direction:
-                case 'up' | 'down':
-                    next_directions = [direction]
-                case 'left' | 'right':
-                    next_directions = ['up', 'down']
-                case _:
-                    raise Exception('unexpected direction')
-        case '-':
-            match direction:
-                case 'up' | 'down':
-                    next_directions = ['left', 'right']
-                case 'left' | 'right':
-                    next_directions = [direction]
-                case _:
-                    raise Exception('unexpected direction')
-        case '/':
-            match direction:
-                case 'up':
-                    next_directions = ['right']
-                case 'down':
-                    next_directions = ['left']
-                case 'left':
-                    next_directions = ['down']
-                case 'right':
-                    next_directions = ['up']
-                case _:
-                    raise Exception('unexpected direction')
-        case '\\':
-            match direction:
-                case 'up':
-                    next_directions = ['left']
-                case 'down':
-                    next_directions = ['right']
-                case 'left':
-                    next_directions = ['up']
-                case 'right':
-                    next_directions = ['down']
-                case _:
-                    raise Exception('unexpected direction')
-        case _:
-            raise Exception('unexpected cell')
-
-    for next_direction in next_directions:
-        next_location: Location
-        match next_direction:
-            case 'up':
-                next_location = (location[0] - 1, location[1])
-            case 'down':
-                next_location = (location[0] + 1, location[1])
-            case 'left':
-                next_location = (location[0], location[1] - 1)
-            case 'right':
-                next_location = (location[0], location[1] + 1)
-            case _:
-                raise Exception('unexpected direction')
-
-        if next_location[0] < 0 or next_location[0] >= len(grid):
-            continue
-        if next_location[1] < 0 or next_location[1] >= len(grid[0]):
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid
+from adventofcode.y2023.d16 import p1
+
+State = p1.State
+
+
+# the cells a beam crosses until it reaches a splitter side on, where it splits in two,
+# or until it leaves the grid or starts repeating itself
+@dataclass(frozen=True, kw_only=True)
+class Segment:
+    cells: int  # bitset indexed by cell index
+    split_state: Optional[State]
+
+
+# the condensed beam graph: a node per splitter that splits a beam, with the segments
+# leading from it to the next splitters
+@dataclass(frozen=True, kw_only=True)
+class SplitterGraph:
+    cells_by_node: Sequence[int]
+    successors: Sequence[Sequence[int]]
+
+
+def find_edge_states(*, grid: Grid) -> List[State]:
+    edge_states: List[State] = []
+    for row_index in range(grid.height):
+        edge_states.append(p1.to_state(direction=p1.RIGHT, grid=grid, location=(row_index, 0)))
+        edge_states.append(p1.to_state(direction=p1.LEFT, grid=grid, location=(row_index, grid.width - 1)))
+
+    for column_index in range(grid.width):
+        edge_states.append(p1.to_state(direction=p1.DOWN, grid=grid, location=(0, column_index)))
+        edge_states.append(p1.to_state(direction=p1.UP, grid=grid, location=(grid.height - 1, column_index)))
+
+    return edge_states
+
+
+def is_split(*, grid: Grid, state: State) -> bool:
+    cell_index, direction = divmod(state, p1.DIRECTION_COUNT)
+    return len(p1.NEXT_DIRECTIONS_BY_CELL[grid.cells[cell_index]][direction]) > 1
+
+
+def follow_beam(*, grid: Grid, state: State) -> Segment:
+    cells = 0
+    visited_states: Set[State] = set()
+    while state not in visited_states:
+        visited_states.add(state)
+        cells |= 1 << (state // p1.DIRECTION_COUNT)
+
+        if is_split(grid=grid, state=state):
+            return Segment(cells=cells, split_state=state)
+
+        next_states = p1.find_next_states(grid=grid, state=state)
+        if len(next_states) == 0:
+            break
+
+        state, = next_states
+
+    return Segment(cells=cells, split_state=None)
+
+
+# splitters are keyed by cell, since a beam hitting a splitter from either side leaves it
+# the same way; returns the graph and the node each edge segment runs into (or None)
+def build_splitter_graph(*, edge_segments: Sequence[Segment], grid: Grid) -> Tuple[SplitterGraph, List[Optional[int]]]:
+    nodes_by_cell: Dict[int, int] = {}
+    split_states: List[State] = []
+
+    def find_node(segment: Segment) -> Optional[int]:
+        if segment.split_state is None:
+            return None
+
+        cell_index = segment.split_state // p1.DIRECTION_COUNT
+        if cell_index not in nodes_by_cell:
+            nodes_by_cell[cell_index] = len(split_states)
+            split_states.append(segment.split_state)
+
+        return nodes_by_cell[cell_index]
+
+    edge_nodes = [find_node(segment) for segment in edge_segments]
+
+    cells_by_node: List[int] = []
+    successors: List[List[int]] = []
+    while len(cells_by_node) < len(split_states):
+        split_state = split_states[len(cells_by_node)]
+
+        cells = 1 << (split_state // p1.DIRECTION_COUNT)
+        next_nodes = []
+        for next_state in p1.find_next_states(grid=grid, state=split_state):
+            segment = follow_beam(grid=grid, state=next_state)
+            cells |= segment.cells
+
+            next_node = find_node(segment)
+            if next_node is not None:
+                next_nodes.append(next_node)
+
+        cells_by_node.append(cells)
+        successors.append(next_nodes)
+
+    return SplitterGraph(cells_by_node=cells_by_node, successors=successors), edge_nodes
+
+
+# Tarjan's algorithm with an explicit stack, limited to the nodes reachable from roots;
+# components come out in reverse topological order, so every component that can be reached
+# from a component is listed before it
+def find_components(*, roots: Sequence[int], successors: Sequence[Sequence[int]]) -> List[List[int]]:
+    indices = array('i', [-1]) * len(successors)
+    low_links = array('i', [0]) * len(successors)
+    is_on_stack = bytearray(len(successors))
+
+    components: List[List[int]] = []
+    stack: List[int] = []
+    next_index = 0
+    for root in roots:
+        if indices[root] != -1:
             continue
 
-        walk_path(
-            grid=grid,
-            step=(next_location, next_direction),
-            visited_steps=visited_steps,
-        )
+        indices[root] = low_links[root] = next_index
+        next_index += 1
+        stack.append(root)
+        is_on_stack[root] = 1
 
+        work: List[Tuple[int, int]] = [(root, 0)]
+        while len(work) > 0:
+            node, successor_index = work[-1]
 
-def calculate_energized_tiles(*, grid: Grid, initial_step: Step) -> int:
-    visited_steps: Set[Step] = set()
-    walk_path(
-        grid=grid,
-        step=initial_step,
-        visited_steps=visited_steps,
-    )
+            if successor_index < len(successors[node]):
+                work[-1] = (node, successor_index + 1)
 
-    visited_locations = set(
-        step[0]
-        for step in visited_steps
-    )
+                next_node = successors[node][successor_index]
+                if indices[next_node] == -1:
+                    indices[next_node] = low_links[next_node] = next_index
+                    next_index += 1
+                    stack.append(next_node)
+                    is_on_stack[next_node] = 1
+                    work.append((next_node, 0))
+                elif is_on_stack[next_node]:
+                    low_links[node] = min(low_links[node], indices[next_node])
+
+                continue
+
+            work.pop()
+            if len(work) > 0:
+                parent_node = work[-1][0]
+                low_links[parent_node] = min(low_links[parent_node], low_links[node])
+
+            if low_links[node] == indices[node]:
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    is_on_stack[member] = 0
+                    component.append(member)
 
-    return len(visited_locations)
+                    if member == node:
+                        break
 
+                components.append(component)
 
+    return components
+
+
+# every cell energized from each component: its own segments plus those of every
+# component it leads to, which come earlier in the list
+def find_energized_cells(*, components: Sequence[Sequence[int]], graph: SplitterGraph) -> Tuple[List[int], List[int]]:
+    component_indices = [-1] * len(graph.successors)
+    for component_index, component in enumerate(components):
+        for node in component:
+            component_indices[node] = component_index
+
+    energized_cells_by_component: List[int] = []
+    for component_index, component in enumerate(components):
+        energized_cells = 0
+        for node in component:
+            energized_cells |= graph.cells_by_node[node]
+
+            for next_node in graph.successors[node]:
+                if component_indices[next_node] != component_index:
+                    energized_cells |= energized_cells_by_component[component_indices[next_node]]
+
+        energized_cells_by_component.append(energized_cells)
+
+    return component_indices, energized_cells_by_component
+
+
+@registry.register
 def solution(content: str, /) -> int:
-    grid = CONTENT.parse(content)
-
-    values: Sequence[int] = []
-    for row_index, row in enumerate(grid):
-        for column_index in range(len(row)):
-            location = (row_index, column_index)
-            directions: Sequence[Direction] = []
-            if row_index == 0:
-                directions.append('down')
-            elif row_index == len(grid) - 1:
-                directions.append('up')
-
-            if column_index == 0:
-                directions.append('right')
-            elif column_index == len(row) - 1:
-                directions.append('left')
-
-            for direction in directions:
-                values.append(
-                    calculate_energized_tiles(
-                        grid=grid,
-                        initial_step=(location, direction),
-                    )
-                )
-
-    return max(values)
+    grid = Grid.from_content(content, alphabet=p1.CELLS)
+
+    edge_segments = [
+        follow_beam(grid=grid, state=edge_state)
+        for edge_state in find_edge_states(grid=grid)
+    ]
+    graph, edge_nodes = build_splitter_graph(edge_segments=edge_segments, grid=grid)
+
+    components = find_components(
+        roots=[node for node in edge_nodes if node is not None],
+        successors=graph.successors,
+    )
+    component_indices, energized_cells_by_component = find_energized_cells(components=components, graph=graph)
+
+    return max(
+        (
+            segment.cells
+            if node is None
+            else segment.cells | energized_cells_by_component[component_indices[node]]
+        ).bit_count()
+        for segment, node in zip(edge_segments, edge_nodes)
+    )
 
 
 def main():
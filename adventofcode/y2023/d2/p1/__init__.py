@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Sequence, Dict, Tuple
 
-from adventofcode.helpers import executor, strings
+from adventofcode.helpers import executor, registry, strings
 
 
 COLORS = {'red', 'green', 'blue'}
@@ -96,6 +96,7 @@ def is_game_valid(*, game: Game) -> bool:
     )
 
 
+@registry.register
 def solution(content: str, /) -> None:
     return sum(
         game.id_
@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from adventofcode.helpers import executor
+from adventofcode.helpers import executor, registry
 from adventofcode.y2023.d2 import p1
 
 
@@ -19,6 +19,7 @@ def calculate_power(*, game: p1.Game) -> int:
     return max_red * max_green * max_blue
 
 
+@registry.register
 def solution(content: str, /) -> None:
     return sum(
         calculate_power(game=game)
@@ -1,10 +1,15 @@
 from dataclasses import dataclass
-from typing import Sequence, Tuple, Set
+import re
+from typing import List, Sequence
 
-from adventofcode.helpers import executor
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Grid, Location
 
 
-Location = Tuple[int, int]  # (row_index, column_index)
+DIGITS = b'0123456789'
+SYMBOLS = b'*#+$%=-/@&'
+
+NUMBER_PATTERN = re.compile(rb'\d+')
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -14,96 +19,51 @@ class PartNumber:
 
 
 @dataclass(frozen=True, kw_only=True)
-class Grid:
-    symbol_locations: Set[Location]
+class Schematic:
+    grid: Grid
     part_numbers: Sequence[PartNumber]
 
 
-def parse_grid(*, lines: Sequence[str]) -> Grid:
-    symbol_locations: Set[Location] = set()
-    part_numbers: Sequence[PartNumber] = []
-
-    for row_index, line in enumerate(lines):
-        part_number_locations: Sequence[Location] = []
-        part_number_value: int = 0
-
-        for column_index, char in enumerate(line):
-            if char.isdigit():
-                part_number_locations.append((row_index, column_index))
-                if part_number_value == 0:
-                    part_number_value = int(char)
-                else:
-                    part_number_value = (10 * part_number_value) + int(char)
-            else:
-                if part_number_value > 0:
-                    part_numbers.append(
-                        PartNumber(
-                            locations=part_number_locations,
-                            value=part_number_value
-                        )
-                    )
-                    part_number_locations = []
-                    part_number_value = 0
-
-                match char:
-                    case '.':
-                        continue
-                    case '*' | '#' | '+' | '$' | '%' | '=' | '-' | '/' | '@' | '&':
-                        symbol_locations.add((row_index, column_index))
-                    case _:
-                        raise Exception(f'unexpected character: {char}')
-
-        if part_number_value > 0:
+def parse_schematic(*, content: str) -> Schematic:
+    grid = Grid.from_content(content, alphabet=b'.' + DIGITS + SYMBOLS)
+
+    part_numbers: List[PartNumber] = []
+    for row_index, row in enumerate(grid.rows()):
+        for match in NUMBER_PATTERN.finditer(row):
             part_numbers.append(
                 PartNumber(
-                    locations=part_number_locations,
-                    value=part_number_value
+                    locations=[
+                        (row_index, column_index)
+                        for column_index in range(match.start(), match.end())
+                    ],
+                    value=int(match.group()),
                 )
             )
-    
-    return Grid(
-        part_numbers=part_numbers,
-        symbol_locations=symbol_locations,
-    )
-
-
-def get_adjacent_locations(*, location: Location) -> Set[Location]:
-    adjacent_locations: Set[Location] = set()
-    for row_adjustment in (-1, 0, 1):
-        for column_adjustment in (-1, 0, 1):
-            if row_adjustment == 0 and column_adjustment == 0:
-                continue
 
-            adjacent_locations.add(
-                (location[0] + row_adjustment, location[1] + column_adjustment)
-            )
-    
-    return adjacent_locations
-
-
-def is_location_near_a_symbol(*, location: Location, symbol_locations: Set[Location]) -> bool:
-    return any(
-        adjacent_location in symbol_locations
-        for adjacent_location in get_adjacent_locations(location=location)
+    return Schematic(
+        grid=grid,
+        part_numbers=part_numbers,
     )
 
 
-def is_part_number_near_a_symbol(*, part_number: PartNumber, symbol_locations: Set[Location]) -> bool:
+def is_part_number_near_a_symbol(*, grid: Grid, part_number: PartNumber) -> bool:
     return any(
-        is_location_near_a_symbol(location=location, symbol_locations=symbol_locations)
+        grid[adjacent_location] in SYMBOLS
         for location in part_number.locations
+        for adjacent_location in grid.neighbors(location, diagonal=True)
     )
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    grid = parse_grid(lines=content.split('\n'))
+    schematic = parse_schematic(content=content)
 
     return sum(
         part_number.value
-        for part_number in grid.part_numbers
+        for part_number in schematic.part_numbers
         if is_part_number_near_a_symbol(
+            grid=schematic.grid,
             part_number=part_number,
-            symbol_locations=grid.symbol_locations,
         )
     )
 
@@ -1,115 +1,51 @@
-from dataclasses import dataclass
-from typing import Sequence, Tuple, Set
-
-from adventofcode.helpers import executor
-
-
-Location = Tuple[int, int]  # (row_index, column_index)
-
-
-@dataclass(frozen=True, kw_only=True)
-class PartNumber:
-    locations: Set[Location]
-    value: int
-
-
-@dataclass(frozen=True, kw_only=True)
-class Grid:
-    gear_locations: Set[Location]
-    part_numbers: Sequence[PartNumber]
-
-
-def parse_grid(*, lines: Sequence[str]) -> Grid:
-    gear_locations: Set[Location] = set()
-    part_numbers: Sequence[PartNumber] = []
-
-    for row_index, line in enumerate(lines):
-        part_number_locations: Set[Location] = set()
-        part_number_value: int = 0
-
-        for column_index, char in enumerate(line):
-            if char.isdigit():
-                part_number_locations.add((row_index, column_index))
-                if part_number_value == 0:
-                    part_number_value = int(char)
-                else:
-                    part_number_value = (10 * part_number_value) + int(char)
-            else:
-                if part_number_value > 0:
-                    part_numbers.append(
-                        PartNumber(
-                            locations=part_number_locations,
-                            value=part_number_value
-                        )
-                    )
-                    part_number_locations = set()
-                    part_number_value = 0
-
-                match char:
-                    case '.' | '#' | '+' | '$' | '%' | '=' | '-' | '/' | '@' | '&':
-                        continue
-                    case '*':
-                        gear_locations.add((row_index, column_index))
-                    case _:
-                        raise Exception(f'unexpected character: {char}')
-
-        if part_number_value > 0:
-            part_numbers.append(
-                PartNumber(
-                    locations=part_number_locations,
-                    value=part_number_value
-                )
-            )
-    
-    return Grid(
-        part_numbers=part_numbers,
-        gear_locations=gear_locations,
-    )
+from array import array
+from typing import Set
 
+from adventofcode.helpers import executor, registry
+from adventofcode.helpers.grid import Location
+from adventofcode.y2023.d3 import p1
 
-def get_adjacent_locations(*, location: Location) -> Set[Location]:
-    adjacent_locations: Set[Location] = set()
-    for row_adjustment in (-1, 0, 1):
-        for column_adjustment in (-1, 0, 1):
-            if row_adjustment == 0 and column_adjustment == 0:
-                continue
 
-            adjacent_locations.add(
-                (location[0] + row_adjustment, location[1] + column_adjustment)
-            )
-    
-    return adjacent_locations
+GEAR = ord('*')
 
 
-def is_location_near_part_number(*, location: Location, part_number: PartNumber) -> bool:
-    return any(
-        adjacent_location in part_number.locations
-        for adjacent_location in get_adjacent_locations(location=location)
-    )
+# maps every cell of the grid to the index of the part number covering it, or -1
+def index_part_numbers(*, schematic: p1.Schematic) -> array:
+    part_number_indices = array('i', [-1]) * len(schematic.grid.cells)
 
+    for part_number_index, part_number in enumerate(schematic.part_numbers):
+        for location in part_number.locations:
+            part_number_indices[schematic.grid.index(location)] = part_number_index
 
-def get_adjacent_part_numbers(*, location: Location, part_numbers: Sequence[PartNumber]) -> Sequence[PartNumber]:
-    return tuple(
-        part_number
-        for part_number in part_numbers
-        if is_location_near_part_number(location=location, part_number=part_number)
-    )
+    return part_number_indices
 
 
-def calculate_gear_ratio(*, gear_location: Location, part_numbers: Sequence[PartNumber]) -> int:
-    adjacent_part_numbers = get_adjacent_part_numbers(location=gear_location, part_numbers=part_numbers)
-    if len(adjacent_part_numbers) != 2:
+def calculate_gear_ratio(*, gear_location: Location, part_number_indices: array, schematic: p1.Schematic) -> int:
+    adjacent_part_number_indices: Set[int] = set(
+        part_number_indices[schematic.grid.index(adjacent_location)]
+        for adjacent_location in schematic.grid.neighbors(gear_location, diagonal=True)
+    )
+    adjacent_part_number_indices.discard(-1)
+
+    if len(adjacent_part_number_indices) != 2:
         return 0
 
-    return adjacent_part_numbers[0].value * adjacent_part_numbers[1].value
+    first_index, second_index = adjacent_part_number_indices
+    return schematic.part_numbers[first_index].value * schematic.part_numbers[second_index].value
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    grid = parse_grid(lines=content.split('\n'))
+    schematic = p1.parse_schematic(content=content)
+    part_number_indices = index_part_numbers(schematic=schematic)
 
     return sum(
-        calculate_gear_ratio(gear_location=gear_location, part_numbers=grid.part_numbers)
-        for gear_location in grid.gear_locations
+        calculate_gear_ratio(
+            gear_location=gear_location,
+            part_number_indices=part_number_indices,
+            schematic=schematic,
+        )
+        for gear_location in schematic.grid.find_all(GEAR)
     )
 
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import parsy
 from typing import Sequence, Set
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 LINE = (
@@ -51,6 +51,7 @@ def calculate_points(*, scratch_card: ScratchCard) -> int:
     return 0 if count == 0 else 2 ** (count - 1)
 
 
+@registry.register
 def solution(content: str, /) -> int:
     return sum(
         calculate_points(
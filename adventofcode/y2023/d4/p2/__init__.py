@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Sequence, Set, Dict
 import parsy
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 LINE = (
@@ -71,6 +71,7 @@ def calculate_points(*, scratch_cards: Sequence[ScratchCard]) -> int:
     return sum(copies_by_id.values())
 
 
+@registry.register
 def solution(content: str, /) -> int:
     scratch_cards = tuple(
         parse_scratch_card(line=line)
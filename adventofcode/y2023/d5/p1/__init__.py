@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import parsy
 from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, intervals, parsers, registry
 
 
 SEEDS_LINE = parsy.string('seeds: ').then(parsers.NUMBER_LIST)
@@ -76,7 +76,7 @@ def parse_almanac(*, content: str) -> Almanac:
         light_to_temperature_maps,
         temperature_to_humidity_maps,
         humidity_to_location_maps,
-    ) = FILE.parse(content)
+    ) = parsers.parse(FILE, content)
 
     return Almanac(
         seeds=seeds,
@@ -90,34 +90,36 @@ def parse_almanac(*, content: str) -> Almanac:
     )
 
 
-def get_destination_value(*, category_maps: Sequence[CategoryMap], source: int) -> int:
-    for category_map in category_maps:
-        distance = source - category_map.source_start
-        if distance >= 0 and distance < category_map.length:
-            return category_map.destination_start + distance
-
-    return source
-
+def to_linear_map(*, category_maps: Sequence[CategoryMap]) -> intervals.PiecewiseLinearMap:
+    return intervals.PiecewiseLinearMap.from_ranges(
+        (category_map.destination_start, category_map.source_start, category_map.length)
+        for category_map in category_maps
+    )
 
-def calculate_seed_location(*, almanac: Almanac, seed: int) -> int:
-    soil = get_destination_value(category_maps=almanac.seed_to_soil, source=seed)
-    fertilizer = get_destination_value(category_maps=almanac.soil_to_fertilizer, source=soil)
-    water = get_destination_value(category_maps=almanac.fertilizer_to_water, source=fertilizer)
-    light = get_destination_value(category_maps=almanac.water_to_light, source=water)
-    temperature = get_destination_value(category_maps=almanac.light_to_temperature, source=light)
-    humidity = get_destination_value(category_maps=almanac.temperature_to_humidity, source=temperature)
-    location = get_destination_value(category_maps=almanac.humidity_to_location, source=humidity)
 
-    return location
+# one sorted breakpoint table from seed straight to location, so that looking up a seed
+# is a single bisect however many stages there are
+def compose_category_maps(*, almanac: Almanac) -> intervals.PiecewiseLinearMap:
+    return intervals.compose(
+        to_linear_map(category_maps=category_maps)
+        for category_maps in (
+            almanac.seed_to_soil,
+            almanac.soil_to_fertilizer,
+            almanac.fertilizer_to_water,
+            almanac.water_to_light,
+            almanac.light_to_temperature,
+            almanac.temperature_to_humidity,
+            almanac.humidity_to_location,
+        )
+    )
 
 
+@registry.register
 def solution(content: str, /) -> int:
     almanac = parse_almanac(content=content)
+    seed_to_location = compose_category_maps(almanac=almanac)
 
-    return min(
-        calculate_seed_location(almanac=almanac, seed=seed)
-        for seed in almanac.seeds
-    )
+    return min(seed_to_location.map_values(almanac.seeds))
 
 
 def main():
@@ -3,7 +3,7 @@ import functools
 import parsy
 from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 TIMES_LINE = (
@@ -30,7 +30,7 @@ class Race:
 
 
 def parse_races(*, content: str) -> Sequence[Race]:
-    times, distances = CONTENT.parse(content)
+    times, distances = parsers.parse(CONTENT, content)
     assert len(times) == len(distances)
 
     return tuple(
@@ -55,6 +55,7 @@ def calculate_win_count(*, race: Race) -> int:
     raise Exception('expected to find result')
 
 
+@registry.register
 def solution(content: str, /) -> int:
     races = parse_races(content=content)
     win_counts = tuple(
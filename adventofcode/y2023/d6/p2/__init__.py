@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import parsy
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 CONCATENATED_NUMBER_LIST = (
@@ -35,7 +35,7 @@ class Race:
 
 
 def parse_race(*, content: str) -> Race:
-    time, distance = CONTENT.parse(content)
+    time, distance = parsers.parse(CONTENT, content)
     return Race(distance=distance, time=time)
 
 
@@ -55,6 +55,7 @@ def calculate_win_count(*, race: Race) -> int:
     raise Exception('expected to find result')
 
 
+@registry.register
 def solution(content: str, /) -> int:
     race = parse_race(content=content)
     return calculate_win_count(race=race)
@@ -1,28 +1,40 @@
+from array import array
 from dataclasses import dataclass
+import functools
+import itertools
 import parsy
-from typing import Sequence, Tuple
+import sys
+from typing import Dict, List, Optional, Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 CARD_LETTERS = 'AKQJT98765432'
-SCORES_BY_CARD_LETTER = {
-    letter: len(CARD_LETTERS) - i
-    for i, letter in enumerate(CARD_LETTERS)
+CARD_COUNT = len(CARD_LETTERS)
+HAND_SIZE = 5
+HAND_COUNT = CARD_COUNT ** HAND_SIZE
+JOKER_MARKER = HAND_SIZE
+
+# a hand's type follows from how many different cards it holds and how many of its most
+# common card there are, once any jokers have joined the most common card
+HAND_TYPE_SCORES_BY_SHAPE = {
+    (0, 5): 6,  # Five of a kind (all jokers)
+    (1, 5): 6,  # Five of a kind
+    (2, 4): 5,  # Four of a kind
+    (2, 3): 4,  # Full house
+    (3, 3): 3,  # Three of a kind
+    (3, 2): 2,  # Two pair
+    (4, 2): 1,  # One pair
+    (5, 1): 0,  # High card
 }
 
-HAND_TYPES = (
-    (5,),             # Five of a kind
-    (1, 4),           # Four of a kind
-    (2, 3),           # Full house
-    (1, 1, 3),        # Three of a kind
-    (1, 2, 2),        # Two pair
-    (1, 1, 1, 2),     # One pair
-    (1, 1, 1, 1, 1),  # High card
-)
-SCORES_BY_HAND_TYPE = {
-    hand_type: len(HAND_TYPES) - i
-    for i, hand_type in enumerate(HAND_TYPES)
-}
+
+@dataclass(frozen=True, kw_only=True)
+class Rules:
+    card_letters: str  # strongest first
+    joker: Optional[str]
+
+
+RULES = Rules(card_letters=CARD_LETTERS, joker=None)
 
 CARD = parsy.regex(rf'[{CARD_LETTERS}]')
 HAND = CARD.times(5).concat()
@@ -46,7 +58,7 @@ class Hand:
 
 
 def parse_hands(*, content: str) -> Sequence[Hand]:
-    hands = CONTENT.parse(content)
+    hands = parsers.parse(CONTENT, content)
 
     return tuple(
         Hand(bid=bid, cards=cards)
@@ -54,36 +66,85 @@ def parse_hands(*, content: str) -> Sequence[Hand]:
     )
 
 
-def determine_hand_type(*, cards: str) -> Tuple:
-    counts_by_card = {}
-    for card in cards:
-        if card not in counts_by_card:
-            counts_by_card[card] = 0
+# turns each card into its base 13 digit, weakest card first, so that a hand read as a
+# base 13 number is its index in the ranking table
+def create_digit_table(*, rules: Rules) -> Dict[int, int]:
+    return str.maketrans(
+        rules.card_letters,
+        ''.join(
+            '0123456789abc'[CARD_COUNT - 1 - i]
+            for i in range(CARD_COUNT)
+        ),
+    )
+
+
+# for a given first four cards, the score of the hand type by how many of the fifth card
+# they already hold, or by JOKER_MARKER when the fifth card is a joker
+@functools.lru_cache(maxsize=None)
+def create_fifth_card_table(*, distinct_count: int, joker_count: int, max_count: int) -> bytes:
+    table = bytearray(256)
+    for count in range(HAND_SIZE):
+        if count == 0:
+            shape = (distinct_count + 1, max(max_count, 1) + joker_count)
+        else:
+            shape = (distinct_count, max(max_count, count + 1) + joker_count)
 
-        counts_by_card[card] += 1
+        # counts the first four cards cannot reach have no shape and are never looked up
+        table[count] = HAND_TYPE_SCORES_BY_SHAPE.get(shape, 0)
 
-    return tuple(sorted(counts_by_card.values()))
+    table[JOKER_MARKER] = HAND_TYPE_SCORES_BY_SHAPE[(distinct_count, max_count + joker_count + 1)]
+    return bytes(table)
 
 
-def calculate_score(*, cards: str) -> int:
-    hand_type = determine_hand_type(cards=cards)
+# the rank of every hand under the rules, as the hand type score in the top byte above
+# the hand's own index, so that comparing two entries compares the hands; the hand types of all
+# thirteen hands sharing their first four cards come from one translate of those cards' counts
+@functools.lru_cache(maxsize=None)
+def build_ranking_table(*, rules: Rules) -> array:
+    joker_digit = None if rules.joker is None else CARD_COUNT - 1 - rules.card_letters.index(rules.joker)
 
-    multiplier = 1
-    score = 0
-    for i in range(len(cards) - 1, -1, -1):
-        card = cards[i]
-        score += multiplier * SCORES_BY_CARD_LETTER[card]
-        multiplier *= 100
+    hand_type_scores = bytearray()
+    for prefix in itertools.product(range(CARD_COUNT), repeat=HAND_SIZE - 1):
+        counts = bytearray(CARD_COUNT)
+        for digit in prefix:
+            counts[digit] += 1
 
-    score += multiplier * SCORES_BY_HAND_TYPE[hand_type]
-    return score
+        joker_count = 0
+        if joker_digit is not None:
+            joker_count = counts[joker_digit]
+            counts[joker_digit] = 0
 
+        fifth_card_table = create_fifth_card_table(
+            distinct_count=CARD_COUNT - counts.count(0),
+            joker_count=joker_count,
+            max_count=max(counts),
+        )
 
-def calculate_total_winnings(*, hands: Sequence[Hand]) -> int:
-    scores_and_hands = list(
-        (calculate_score(cards=hand.cards), hand)
+        if joker_digit is not None:
+            counts[joker_digit] = JOKER_MARKER
+
+        hand_type_scores += counts.translate(fifth_card_table)
+
+    # writes the scores straight into the top byte of every entry
+    table = array('I', range(HAND_COUNT))
+    top_byte_offset = table.itemsize - 1 if sys.byteorder == 'little' else 0
+    memoryview(table).cast('B')[top_byte_offset::table.itemsize] = hand_type_scores
+
+    return table
+
+
+def calculate_scores(*, hands: Sequence[Hand], rules: Rules) -> List[int]:
+    table = build_ranking_table(rules=rules)
+    digit_table = create_digit_table(rules=rules)
+
+    return [
+        table[int(hand.cards.translate(digit_table), CARD_COUNT)]
         for hand in hands
-    )
+    ]
+
+
+def calculate_total_winnings(*, hands: Sequence[Hand], rules: Rules) -> int:
+    scores_and_hands = list(zip(calculate_scores(hands=hands, rules=rules), hands))
     scores_and_hands.sort(key=lambda x: x[0])
 
     return sum(
@@ -92,9 +153,10 @@ def calculate_total_winnings(*, hands: Sequence[Hand]) -> int:
     )
 
 
+@registry.register
 def solution(content: str, /) -> int:
     hands = parse_hands(content=content)
-    return calculate_total_winnings(hands=hands)
+    return calculate_total_winnings(hands=hands, rules=RULES)
 
 
 def main():
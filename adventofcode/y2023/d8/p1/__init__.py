@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import parsy
 from typing import Sequence, Dict
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 DIRECTION = parsy.regex(r'[RL]')
@@ -45,7 +45,7 @@ class Network:
 
 
 def parse_network(*, content: str) -> Network:
-    directions, nodes = CONTENT.parse(content)
+    directions, nodes = parsers.parse(CONTENT, content)
 
     nodes_by_name = {}
     for (node_name, left, right) in nodes:
@@ -98,6 +98,7 @@ def count_steps(*, network: Network) -> int:
     return step_count
 
 
+@registry.register
 def solution(content: str, /) -> int:
     network = parse_network(content=content)
     return count_steps(network=network)
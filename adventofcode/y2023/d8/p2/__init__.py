@@ -3,7 +3,7 @@ import parsy
 import functools
 from typing import Sequence, Dict
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 DIRECTION = parsy.regex(r'[RL]')
@@ -46,7 +46,7 @@ class Network:
 
 
 def parse_network(*, content: str) -> Network:
-    directions, nodes = CONTENT.parse(content)
+    directions, nodes = parsers.parse(CONTENT, content)
 
     nodes_by_name = {}
     for (node_name, left, right) in nodes:
@@ -132,6 +132,7 @@ def calculate_destination_nodes_by_name(*, network: Network) -> Dict[str, str]:
     return destination_nodes_by_name
 
 
+@registry.register
 def solution(content: str, /) -> int:
     network = parse_network(content=content)
     destination_nodes_by_name = calculate_destination_nodes_by_name(network=network)
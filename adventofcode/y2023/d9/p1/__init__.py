@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 CONTENT = (
@@ -31,8 +31,9 @@ def calculate_next_value(*, history: Sequence[int]) -> int:
     return next_diff_value + history[-1]
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    histories = CONTENT.parse(content)
+    histories = parsers.parse(CONTENT, content)
 
     return sum(
         calculate_next_value(history=history)
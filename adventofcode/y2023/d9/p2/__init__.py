@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from adventofcode.helpers import executor, parsers
+from adventofcode.helpers import executor, parsers, registry
 
 
 CONTENT = (
@@ -31,8 +31,9 @@ def calculate_previous_value(*, history: Sequence[int]) -> int:
     return history[0] - previous_diff_value
 
 
+@registry.register
 def solution(content: str, /) -> int:
-    histories = CONTENT.parse(content)
+    histories = parsers.parse(CONTENT, content)
 
     return sum(
         calculate_previous_value(history=history)
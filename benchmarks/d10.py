@@ -0,0 +1,50 @@
+import argparse
+import sys
+from typing import Callable, Sequence
+
+from adventofcode.helpers import resources
+from adventofcode.y2023.d10 import p1, p2
+from benchmarks import timing
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare the d10 ray walk with the shoelace formula and pick\'s theorem.')
+    parser.add_argument('--repeat', default=5, help='measured runs per implementation', type=int)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    directory_path = resources.RESOURCES_DIRECTORY_PATH / 'y2023' / 'd10'
+
+    print(f'{"input":>8}{"ray walk":>14}{"shoelace":>14}{"speedup":>10}')
+    print('-' * 46)
+
+    mismatch_count = 0
+    for name, read in (('example', resources.read_example), ('actual', resources.read_actual)):
+        sketch = p1.parse_sketch(content=read(directory_path=directory_path))
+
+        counters: Sequence[Callable[..., int]] = (p2.count_inner_cells_by_ray_walk, p2.count_inner_cells_by_shoelace)
+        if len(set(counter(sketch=sketch) for counter in counters)) != 1:
+            mismatch_count += 1
+            print(f'{name:>8}  MISMATCH')
+            continue
+
+        ray_walk_measurement, shoelace_measurement = [
+            timing.measure(lambda: counter(sketch=sketch), repeat=arguments.repeat, warmup=1)
+            for counter in counters
+        ]
+
+        print(
+            f'{name:>8}'
+            f'{timing.format_nanoseconds(ray_walk_measurement.median_ns):>14}'
+            f'{timing.format_nanoseconds(shoelace_measurement.median_ns):>14}'
+            f'{ray_walk_measurement.median_ns / shoelace_measurement.median_ns:>9.1f}x'
+        )
+
+    return 1 if mismatch_count > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import argparse
+import sys
+from typing import Callable, Hashable, Sequence
+
+from adventofcode.helpers import memo, resources
+from adventofcode.y2023.d12 import p1, p2
+from benchmarks import timing
+
+
+# the recursion goes a few frames deeper for every spring, and unfolded rows get long
+RECURSION_LIMIT = 20_000
+
+
+# within one row every springs argument is a suffix of the row, possibly with its first
+# spring replaced, and every damaged_groups argument is a suffix of the row's groups, so
+# their lengths (and that first spring) identify them without hashing whole strings
+def find_arrangements_key(
+        *,
+        springs: str,
+        damaged_groups: Sequence[int],
+        damage_count: int = 0,
+) -> Hashable:
+    return (len(springs), springs[:1], len(damaged_groups), damage_count)
+
+
+# the original top-down implementation that p1.count_arrangements replaced
+@memo.memoize(key=find_arrangements_key)
+def calculate_arrangements(
+        *,
+        springs: str,
+        damaged_groups: Sequence[int],
+        damage_count: int = 0,
+) -> int:
+    for index, spring in enumerate(springs):
+        match spring:
+            case '#':
+                damage_count += 1
+
+                if len(damaged_groups) == 0:
+                    # invalid configuration
+                    return 0
+
+                if damage_count > damaged_groups[0]:
+                    # invalid configuration
+                    return 0
+            case '.':
+                if damage_count == 0:
+                    continue
+
+                if len(damaged_groups) == 0:
+                    continue
+
+                if damage_count != damaged_groups[0]:
+                    # invalid configuration
+                    return 0
+
+                # good, recurse down
+                return calculate_arrangements(
+                    damaged_groups=damaged_groups[1:],
+                    springs=springs[index + 1:],
+                )
+            case '?':
+                if len(damaged_groups) == 0:
+                    return calculate_arrangements(
+                        damage_count=damage_count,
+                        damaged_groups=damaged_groups,
+                        springs=f'.{springs[index + 1:]}',
+                    )
+
+                if damage_count == damaged_groups[0]:
+                    return calculate_arrangements(
+                        damage_count=0,
+                        damaged_groups=damaged_groups[1:],
+                        springs=f'.{springs[index + 1:]}',
+                    )
+
+                value_if_damaged = calculate_arrangements(
+                    damage_count=damage_count,
+                    damaged_groups=damaged_groups,
+                    springs=f'#{springs[index + 1:]}',
+                )
+                value_if_not_damaged = calculate_arrangements(
+                    damage_count=damage_count,
+                    damaged_groups=damaged_groups,
+                    springs=f'.{springs[index + 1:]}',
+                )
+
+                return value_if_damaged + value_if_not_damaged
+            case _:
+                raise Exception(f'unexpected spring: {spring}')
+
+    if len(damaged_groups) == 0:
+        return 1
+
+    if len(damaged_groups) > 1:
+        # invalid
+        return 0
+
+    if damage_count != damaged_groups[0]:
+        # invalid
+        return 0
+
+    return 1
+
+
+def count_arrangements_recursively(*, damaged_groups: Sequence[int], springs: str) -> int:
+    # the keys are only unique within a row
+    calculate_arrangements.clear()
+
+    return calculate_arrangements(
+        damaged_groups=damaged_groups,
+        springs=springs,
+    )
+
+
+def count_recursively(spring_rows: Sequence[p1.SpringRow], /) -> int:
+    return sum(
+        count_arrangements_recursively(
+            damaged_groups=spring_row.damaged_groups,
+            springs=spring_row.springs,
+        )
+        for spring_row in spring_rows
+    )
+
+
+def count_bottom_up(spring_rows: Sequence[p1.SpringRow], /) -> int:
+    return sum(
+        p1.count_arrangements(
+            damaged_groups=spring_row.damaged_groups,
+            springs=spring_row.springs,
+        )
+        for spring_row in spring_rows
+    )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare the d12 bottom-up arrangement counter with the memoized recursion.')
+    parser.add_argument('--factors', default=[5, 10, 20], help='how many times to unfold each row', nargs='+', type=int)
+    parser.add_argument('--repeat', default=1, help='measured runs per implementation', type=int)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSION_LIMIT))
+
+    content = resources.read_actual(directory_path=resources.RESOURCES_DIRECTORY_PATH / 'y2023' / 'd12')
+    spring_rows = p1.parse_spring_rows(content=content)
+
+    print(f'{"factor":>8}{"recursive":>14}{"bottom-up":>14}{"speedup":>10}')
+    print('-' * 46)
+
+    mismatch_count = 0
+    for factor in arguments.factors:
+        unfolded_spring_rows = [
+            p2.unfold_spring_row(factor=factor, spring_row=spring_row)
+            for spring_row in spring_rows
+        ]
+
+        if count_recursively(unfolded_spring_rows) != count_bottom_up(unfolded_spring_rows):
+            mismatch_count += 1
+            print(f'{factor:>8}  MISMATCH')
+            continue
+
+        counters: Sequence[Callable[[Sequence[p1.SpringRow]], int]] = (count_recursively, count_bottom_up)
+        recursive_measurement, bottom_up_measurement = [
+            timing.measure(lambda: counter(unfolded_spring_rows), repeat=arguments.repeat, warmup=0)
+            for counter in counters
+        ]
+
+        print(
+            f'{factor:>8}'
+            f'{timing.format_nanoseconds(recursive_measurement.median_ns):>14}'
+            f'{timing.format_nanoseconds(bottom_up_measurement.median_ns):>14}'
+            f'{recursive_measurement.median_ns / bottom_up_measurement.median_ns:>9.1f}x'
+        )
+
+    return 1 if mismatch_count > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
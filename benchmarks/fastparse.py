@@ -0,0 +1,140 @@
+import argparse
+from dataclasses import dataclass
+import sys
+from typing import Any, Callable, Sequence
+
+import parsy
+
+from adventofcode.helpers import fastparse, parsers, resources
+from adventofcode.y2023.d8 import p1 as d8
+from adventofcode.y2023.d9 import p1 as d9
+from benchmarks import timing
+
+
+# the grammars d10, d13 and d14 read their grids with before they moved to Grid.from_content
+PIPES = (
+    parsy.regex(r'[\|\-LJ7F\.S]').at_least(1).concat()
+    .sep_by(parsers.NEWLINE)
+    .skip(parsers.NEWLINE.many())
+)
+
+FIELDS = (
+    parsy.regex(r'[\.#]').at_least(1).concat()
+    .sep_by(parsers.NEWLINE)
+    .sep_by(parsers.NEWLINE.times(2))
+    .skip(parsers.NEWLINE.many())
+)
+
+ROCKS = (
+    parsy.regex(r'[\.#O]').at_least(1)
+    .sep_by(parsers.NEWLINE)
+    .skip(parsers.NEWLINE.many())
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Case:
+    enlarge: Callable[[str, int], str]
+    fast: Callable[[str], Any]
+    grammar: parsy.Parser
+    name: str
+    resources_path: str
+
+
+def enlarge_lines(content: str, factor: int, /) -> str:
+    return content.rstrip('\n') + ('\n' + content.rstrip('\n')) * (factor - 1) + '\n'
+
+
+def enlarge_blocks(content: str, factor: int, /) -> str:
+    return content.rstrip('\n') + ('\n\n' + content.rstrip('\n')) * (factor - 1) + '\n'
+
+
+def read_records(content: str, /) -> str:
+    # drops the directions line so that only the records remain
+    _, _, records = content.partition('\n\n')
+    return records
+
+
+CASES = (
+    Case(
+        enlarge=enlarge_lines,
+        fast=fastparse.integer_lists,
+        grammar=d9.CONTENT,
+        name='integer lists (d9)',
+        resources_path='y2023/d9',
+    ),
+    Case(
+        enlarge=enlarge_lines,
+        fast=lambda x: fastparse.grid(x, characters='.#O'),
+        grammar=ROCKS,
+        name='character grid (d14)',
+        resources_path='y2023/d14',
+    ),
+    Case(
+        enlarge=enlarge_lines,
+        fast=lambda x: fastparse.lines(x, characters='|-LJ7F.S'),
+        grammar=PIPES,
+        name='lines (d10)',
+        resources_path='y2023/d10',
+    ),
+    Case(
+        enlarge=enlarge_blocks,
+        fast=lambda x: fastparse.blocks(x, characters='.#'),
+        grammar=FIELDS,
+        name='blocks (d13)',
+        resources_path='y2023/d13',
+    ),
+    Case(
+        enlarge=lambda x, y: enlarge_lines(read_records(x), y),
+        fast=fastparse.records,
+        grammar=d8.NODE_LINE.sep_by(parsers.NEWLINE).skip(parsers.NEWLINE.many()),
+        name='records (d8)',
+        resources_path='y2023/d8',
+    ),
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare fastparse readers with the parsy grammars they replace.')
+    parser.add_argument('--factors', default=[1, 10, 100], help='how many times to repeat each input', nargs='+', type=int)
+    parser.add_argument('--repeat', default=3, help='measured runs per reader', type=int)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    arguments = parse_arguments()
+
+    print(f'{"input":<24}{"factor":>8}{"parsy":>14}{"fastparse":>14}{"speedup":>10}')
+    print('-' * 70)
+
+    mismatch_count = 0
+    for case in CASES:
+        content = resources.read_actual(directory_path=resources.RESOURCES_DIRECTORY_PATH / case.resources_path)
+
+        for factor in arguments.factors:
+            enlarged_content = case.enlarge(content, factor)
+
+            if case.grammar.parse(enlarged_content) != case.fast(enlarged_content):
+                mismatch_count += 1
+                print(f'{case.name:<24}{factor:>8}  MISMATCH')
+                continue
+
+            measurements: Sequence[timing.Measurement] = [
+                timing.measure(lambda: reader(enlarged_content), repeat=arguments.repeat, warmup=0)
+                for reader in (case.grammar.parse, case.fast)
+            ]
+            grammar_measurement, fast_measurement = measurements
+
+            print(
+                f'{case.name:<24}{factor:>8}'
+                f'{timing.format_nanoseconds(grammar_measurement.median_ns):>14}'
+                f'{timing.format_nanoseconds(fast_measurement.median_ns):>14}'
+                f'{grammar_measurement.median_ns / fast_measurement.median_ns:>9.1f}x'
+            )
+
+    return 1 if mismatch_count > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import argparse
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Dict, Optional, Sequence
+
+from adventofcode.helpers import memo, parsers, registry, resources, runner
+from benchmarks import timing
+
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+
+
+@dataclass(frozen=True, kw_only=True)
+class Benchmark:
+    is_correct: bool
+    measurement: timing.Measurement
+    name: str
+
+
+def run_benchmark(*, repeat: int, solution: registry.Solution, warmup: int) -> Benchmark:
+    content = resources.read_actual(directory_path=solution.resources_directory_path)
+    expected_result = resources.read_actual_result(directory_path=solution.resources_directory_path)
+
+    # the executor clears memos after every input, so every run starts from empty memos
+    # here too rather than being timed on the hits left by the previous one
+    memo.clear_all()
+    is_correct = str(solution.consumer(content)) == expected_result
+    measurement = timing.measure(
+        lambda: solution.consumer(content),
+        repeat=repeat,
+        setup=memo.clear_all,
+        warmup=warmup,
+    )
+    memo.clear_all()
+
+    return Benchmark(
+        is_correct=is_correct,
+        measurement=measurement,
+        name=solution.name,
+    )
+
+
+def read_baseline(*, path: Path) -> Dict[str, Dict[str, int]]:
+    if not path.is_file():
+        return {}
+
+    with open(path, 'r') as f:
+        baseline: Dict[str, Dict[str, int]] = json.load(f)
+
+    return baseline
+
+
+def write_baseline(*, benchmarks: Sequence[Benchmark], path: Path) -> None:
+    baseline = read_baseline(path=path)
+    for benchmark in benchmarks:
+        baseline[benchmark.name] = {
+            'median_ns': benchmark.measurement.median_ns,
+            'p95_ns': benchmark.measurement.p95_ns,
+        }
+
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def find_regression(*, baseline: Dict[str, Dict[str, int]], benchmark: Benchmark, threshold: float) -> Optional[float]:
+    if benchmark.name not in baseline:
+        return None
+
+    ratio = benchmark.measurement.median_ns / baseline[benchmark.name]['median_ns']
+    if ratio <= 1 + threshold:
+        return None
+
+    return ratio
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark every solution against its actual input.')
+    parser.add_argument('names', help='only run these solutions, e.g. 2023_12_2', nargs='*')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file to compare against', type=Path)
+    parser.add_argument('--parse-cache', action='store_true', help='let repeated runs reuse parsed inputs')
+    parser.add_argument('--repeat', default=5, help='measured runs per solution', type=int)
+    parser.add_argument('--save', action='store_true', help='record these results as the new baseline')
+    parser.add_argument('--threshold', default=0.2, help='allowed slowdown of the median, as a fraction', type=float)
+    parser.add_argument('--warmup', default=1, help='unmeasured runs per solution', type=int)
+
+    arguments = parser.parse_args()
+    if arguments.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    return arguments
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    if not arguments.parse_cache:
+        os.environ[parsers.PARSE_CACHE_ENVIRONMENT_VARIABLE] = '0'
+
+    baseline = read_baseline(path=arguments.baseline)
+
+    solutions = [
+        solution
+        for solution in runner.find_solutions()
+        if not arguments.names or solution.name in arguments.names
+    ]
+
+    print(f'{"solution":<12}{"median":>14}{"p95":>14}{"baseline":>14}  status')
+    print('-' * 64)
+
+    benchmarks = []
+    failure_count = 0
+    for solution in solutions:
+        benchmark = run_benchmark(
+            repeat=arguments.repeat,
+            solution=solution,
+            warmup=arguments.warmup,
+        )
+        benchmarks.append(benchmark)
+
+        regression = find_regression(baseline=baseline, benchmark=benchmark, threshold=arguments.threshold)
+        if not benchmark.is_correct:
+            status = 'WRONG RESULT'
+        elif regression is not None:
+            status = f'REGRESSED {regression:.2f}x'
+        else:
+            status = 'ok'
+
+        if status != 'ok':
+            failure_count += 1
+
+        baseline_median = (
+            timing.format_nanoseconds(baseline[benchmark.name]['median_ns'])
+            if benchmark.name in baseline
+            else '-'
+        )
+        print(
+            f'{benchmark.name:<12}'
+            f'{timing.format_nanoseconds(benchmark.measurement.median_ns):>14}'
+            f'{timing.format_nanoseconds(benchmark.measurement.p95_ns):>14}'
+            f'{baseline_median:>14}'
+            f'  {status}'
+        )
+
+    if arguments.save:
+        write_baseline(benchmarks=benchmarks, path=arguments.baseline)
+        print(f'Wrote baseline to {arguments.baseline}')
+
+    return 1 if failure_count > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+import statistics
+import time
+from typing import Any, Callable, Optional, Sequence
+
+
+@dataclass(frozen=True, kw_only=True)
+class Measurement:
+    median_ns: int
+    p95_ns: int
+    samples_ns: Sequence[int]
+
+
+def calculate_percentile(samples: Sequence[int], /, *, percentile: float) -> int:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percentile * (len(ordered) - 1)))
+
+    return ordered[index]
+
+
+# setup runs before every call, warmups included, and is not measured
+def measure(
+    function: Callable[[], Any],
+    /,
+    *,
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None,
+    warmup: int,
+) -> Measurement:
+    if repeat < 1:
+        raise Exception(f'expected at least one measured run, got {repeat}')
+
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+
+        function()
+
+    samples_ns = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter_ns()
+        function()
+        samples_ns.append(time.perf_counter_ns() - start)
+
+    return Measurement(
+        median_ns=round(statistics.median(samples_ns)),
+        p95_ns=calculate_percentile(samples_ns, percentile=0.95),
+        samples_ns=tuple(samples_ns),
+    )
+
+
+def format_nanoseconds(value: float, /) -> str:
+    return f'{value / 1_000_000:.3f}ms'